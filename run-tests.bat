@@ -5,7 +5,7 @@ echo Activating virtual environment...
 call .venv\Scripts\activate.bat
 
 echo Installing test dependencies...
-python -m pip install pytest pytest-asyncio responses beautifulsoup4
+python -m pip install pytest "pytest-asyncio>=0.26" pytest-xdist pytest-benchmark responses beautifulsoup4
 
 echo Running core MCP server tests...
 python -m pytest tests/test_models.py tests/test_utils.py tests/test_errors.py tests/test_project_analyzer.py tests/test_package_manager.py tests/test_server.py tests/test_integration.py -v
@@ -16,4 +16,7 @@ echo.
 echo To run all tests including migration features:
 echo python -m pytest tests/ -v
 echo.
+echo To collect benchmark stats (pytest-benchmark is disabled under xdist):
+echo python -m pytest tests/test_migration_performance.py -n0
+echo.
 pause
\ No newline at end of file
@@ -388,6 +388,20 @@ class MigrationAnalyzer:
         hash_obj = hashlib.md5(content.encode())
         return os.path.join(self.cache_dir, f"{prefix}_{hash_obj.hexdigest()}.json")
 
+    def _is_cache_expired(self, timestamp: Optional[str], filename: str, max_age_seconds: float) -> bool:
+        """
+        Check whether a disk cache entry is older than max_age_seconds.
+        
+        Entries saved without a timestamp are aged by the cache file's
+        modification time, so they still expire instead of living forever.
+        """
+        if timestamp:
+            cache_time = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+        else:
+            cache_time = datetime.fromtimestamp(os.path.getmtime(filename), timezone.utc)
+        age = datetime.now(timezone.utc) - cache_time
+        return age.total_seconds() > max_age_seconds
+
     async def _load_cached_api_surface(self, package_name: str, version: str) -> Optional[APISurface]:
         """Load cached API surface from disk."""
         if not self.cache_dir:
@@ -402,11 +416,8 @@ class MigrationAnalyzer:
                 data = json.load(f)
             
             # Check if cache is still valid (24 hours)
-            if 'extraction_timestamp' in data:
-                cache_time = datetime.fromisoformat(data['extraction_timestamp'].replace('Z', '+00:00'))
-                age = datetime.now(timezone.utc) - cache_time
-                if age.total_seconds() > 24 * 3600:  # 24 hours
-                    return None
+            if self._is_cache_expired(data.get('extraction_timestamp'), filename, 24 * 3600):
+                return None
             
             # Reconstruct APISurface from cached data
             from .migration_models import APIElement
@@ -479,11 +490,8 @@ class MigrationAnalyzer:
                 data = json.load(f)
             
             # Check if cache is still valid (24 hours)
-            if 'analysis_timestamp' in data:
-                cache_time = datetime.fromisoformat(data['analysis_timestamp'].replace('Z', '+00:00'))
-                age = datetime.now(timezone.utc) - cache_time
-                if age.total_seconds() > 24 * 3600:  # 24 hours
-                    return None
+            if self._is_cache_expired(data.get('analysis_timestamp'), filename, 24 * 3600):
+                return None
             
             # Reconstruct VersionComparison from cached data
             from .migration_models import APIChange
@@ -564,11 +572,8 @@ class MigrationAnalyzer:
                 data = json.load(f)
             
             # Check if cache is still valid (7 days for migration resources)
-            if 'search_timestamp' in data:
-                cache_time = datetime.fromisoformat(data['search_timestamp'].replace('Z', '+00:00'))
-                age = datetime.now(timezone.utc) - cache_time
-                if age.total_seconds() > 7 * 24 * 3600:  # 7 days
-                    return None
+            if self._is_cache_expired(data.get('search_timestamp'), filename, 7 * 24 * 3600):
+                return None
             
             # Reconstruct MigrationResources from cached data
             from .migration_models import MigrationResource
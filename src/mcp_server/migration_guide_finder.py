@@ -8,18 +8,39 @@ changelogs, and upgrade guides for Python packages across different versions.
 from __future__ import annotations
 
 import re
-import asyncio
 from datetime import datetime, timezone
-from typing import List, Dict, Any, Optional, Set
+from typing import AsyncIterator, List, Dict, Any, Optional, Set, Tuple
 from urllib.parse import urljoin, urlparse
 
+import anyio
 import httpx
 from bs4 import BeautifulSoup
+from packaging.version import Version, InvalidVersion
 
 from .migration_models import MigrationResource, MigrationResources
 from .errors import MigrationResourceError, NetworkError
 from .package_manager import PackageManager
 
+# Matches the owner/repo part of a GitHub URL
+_GITHUB_RE = re.compile(r'github\.com/([^/]+)/([^/]+)')
+
+# Overall deadline (seconds) for the concurrent source lookups
+DISCOVERY_TIMEOUT = 15.0
+
+# Maximum number of release notes collected from GitHub releases
+MAX_RELEASE_NOTES = 10
+# GitHub API page size for paginated endpoints
+GITHUB_PAGE_SIZE = 100
+
+# Resource type -> MigrationResources list attribute; unknown types fall back
+# to documentation_links.
+RESOURCE_CATEGORIES: Dict[str, str] = {
+    'official_guide': 'official_guides',
+    'changelog': 'changelogs',
+    'community_guide': 'community_resources',
+    'documentation': 'documentation_links',
+}
+
 
 class MigrationGuideFinder:
     """
@@ -33,7 +54,11 @@ class MigrationGuideFinder:
         self._client = httpx.AsyncClient(
             timeout=timeout,
             headers={"User-Agent": "pypi-mcp-server/0.1"},
-            follow_redirects=True
+            follow_redirects=True,
+            # GitHub and ReadTheDocs speak HTTP/2, so the concurrent source
+            # lookups can share one multiplexed connection per host.
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
         )
 
     async def find_migration_resources(
@@ -70,17 +95,30 @@ class MigrationGuideFinder:
             urls = await self._extract_urls_from_metadata(package_name)
             
             # Search for resources from different sources
-            tasks = [
-                self._find_github_resources(urls.get('github'), old_version, new_version),
-                self._find_readthedocs_resources(urls.get('readthedocs')),
-                self._find_pypi_resources(package_name),
-                self._find_changelog_resources(urls.get('homepage'), urls.get('repository'))
-            ]
+            sources = {
+                'github': self._find_github_resources(urls.get('github'), old_version, new_version),
+                'readthedocs': self._find_readthedocs_resources(urls.get('readthedocs')),
+                'pypi': self._find_pypi_resources(package_name),
+                'changelog': self._find_changelog_resources(urls.get('homepage'), urls.get('repository')),
+            }
+            results: Dict[str, Any] = {}
+            
+            async def run(name: str, coro) -> None:
+                try:
+                    results[name] = await coro
+                except Exception as e:
+                    results[name] = e
             
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            # Sources still running when the deadline passes are cancelled
+            # and skipped; whatever finished in time is kept.
+            with anyio.move_on_after(DISCOVERY_TIMEOUT):
+                async with anyio.create_task_group() as tg:
+                    for name, coro in sources.items():
+                        tg.start_soon(run, name, coro)
             
             # Merge results from all sources
-            for result in results:
+            for name in sources:
+                result = results.get(name)
                 if isinstance(result, Exception):
                     continue  # Skip failed searches, don't fail the entire operation
                 if isinstance(result, list):
@@ -157,87 +195,151 @@ class MigrationGuideFinder:
         if not github_url:
             return []
         
+        parsed = self._parse_github_repo(github_url)
+        if not parsed:
+            return []
+        owner, repo = parsed
+        
         resources = []
+        try:
+            resources.extend(await self._fetch_releases(owner, repo, old_version, new_version))
+            resources.extend(await self._fetch_changelog(owner, repo, old_version, new_version))
+            resources.extend(await self._fetch_migration_docs(owner, repo, old_version, new_version))
+        except Exception:
+            pass  # Don't fail if GitHub search fails
         
+        return resources
+
+    def _parse_github_repo(self, url: str) -> Optional[Tuple[str, str]]:
+        """Extract the (owner, repo) pair from a GitHub URL."""
+        match = _GITHUB_RE.search(url)
+        if not match:
+            return None
+        owner, repo = match.groups()
+        return owner, repo.removesuffix('.git')
+
+    async def _fetch_releases(
+        self,
+        owner: str,
+        repo: str,
+        old_version: str,
+        new_version: str
+    ) -> List[MigrationResource]:
+        """Collect release notes newer than old_version from GitHub releases."""
+        resources = []
+        # Releases are listed by creation date, not version, so a maintenance
+        # release for an older line can appear between newer ones. Skip tags
+        # outside (old_version, new_version] rather than stopping at the first
+        # old one, and stop paging once a whole page predates old_version.
+        releases_url = f"https://api.github.com/repos/{owner}/{repo}/releases"
+        old_parsed = self._parse_tag_version(old_version)
+        new_parsed = self._parse_tag_version(new_version)
         try:
-            # Extract owner/repo from GitHub URL
-            match = re.search(r'github\.com/([^/]+)/([^/]+)', github_url)
-            if not match:
-                return []
-            
-            owner, repo = match.groups()
-            repo = repo.rstrip('.git')
-            
-            # Check GitHub releases for changelogs
-            releases_url = f"https://api.github.com/repos/{owner}/{repo}/releases"
-            try:
-                response = await self._client.get(releases_url)
-                if response.status_code == 200:
-                    releases = response.json()
-                    for release in releases[:10]:  # Check last 10 releases
-                        tag_name = release.get('tag_name', '')
-                        if self._is_version_relevant(tag_name, old_version, new_version):
-                            resources.append(MigrationResource(
-                                title=f"Release {tag_name}",
-                                url=release.get('html_url', ''),
-                                type='changelog',
-                                version_range=tag_name,
-                                description=release.get('name', '') or f"Release notes for {tag_name}",
-                                source='github'
-                            ))
-            except Exception:
-                pass
-            
-            # Look for common changelog files
-            changelog_files = [
-                'CHANGELOG.md', 'CHANGELOG.rst', 'CHANGELOG.txt',
-                'HISTORY.md', 'HISTORY.rst', 'HISTORY.txt',
-                'CHANGES.md', 'CHANGES.rst', 'CHANGES.txt',
-                'NEWS.md', 'NEWS.rst', 'NEWS.txt'
-            ]
-            
-            for filename in changelog_files:
-                file_url = f"https://raw.githubusercontent.com/{owner}/{repo}/main/{filename}"
-                try:
-                    response = await self._client.get(file_url)
-                    if response.status_code == 200:
+            async for page in self._paginate(releases_url):
+                page_has_newer = False
+                for release in page:
+                    tag_name = release.get('tag_name', '')
+                    tag_version = self._parse_tag_version(tag_name)
+                    if old_parsed and tag_version:
+                        if tag_version <= old_parsed:
+                            continue
+                        page_has_newer = True
+                    if new_parsed and tag_version and tag_version > new_parsed:
+                        continue
+                    if self._is_version_relevant(tag_name, old_version, new_version):
                         resources.append(MigrationResource(
-                            title=f"{filename}",
-                            url=f"https://github.com/{owner}/{repo}/blob/main/{filename}",
+                            title=f"Release {tag_name}",
+                            url=release.get('html_url', ''),
                             type='changelog',
-                            version_range=f"{old_version} -> {new_version}",
-                            description=f"Changelog file from repository",
+                            version_range=tag_name,
+                            description=release.get('name', '') or f"Release notes for {tag_name}",
                             source='github'
                         ))
-                        break  # Found one changelog, don't need to check others
-                except Exception:
-                    continue
-            
-            # Look for migration guides in docs directory
-            docs_url = f"https://api.github.com/repos/{owner}/{repo}/contents/docs"
+                        if len(resources) >= MAX_RELEASE_NOTES:
+                            return resources
+                if old_parsed and not page_has_newer:
+                    break
+        except Exception:
+            pass
+        return resources
+
+    async def _fetch_changelog(
+        self,
+        owner: str,
+        repo: str,
+        old_version: str,
+        new_version: str
+    ) -> List[MigrationResource]:
+        """Look for a changelog file at the root of the repository."""
+        changelog_files = [
+            'CHANGELOG.md', 'CHANGELOG.rst', 'CHANGELOG.txt',
+            'HISTORY.md', 'HISTORY.rst', 'HISTORY.txt',
+            'CHANGES.md', 'CHANGES.rst', 'CHANGES.txt',
+            'NEWS.md', 'NEWS.rst', 'NEWS.txt'
+        ]
+        
+        for filename in changelog_files:
+            file_url = f"https://raw.githubusercontent.com/{owner}/{repo}/main/{filename}"
             try:
-                response = await self._client.get(docs_url)
+                response = await self._client.get(file_url)
                 if response.status_code == 200:
-                    docs_files = response.json()
-                    for file_info in docs_files:
-                        filename = file_info.get('name', '').lower()
-                        if any(keyword in filename for keyword in ['migration', 'upgrade', 'breaking']):
-                            resources.append(MigrationResource(
-                                title=f"Migration Guide: {file_info.get('name')}",
-                                url=file_info.get('html_url', ''),
-                                type='official_guide',
-                                version_range=f"{old_version} -> {new_version}",
-                                description="Migration documentation from repository",
-                                source='github'
-                            ))
+                    # Found one changelog, don't need to check others
+                    return [MigrationResource(
+                        title=f"{filename}",
+                        url=f"https://github.com/{owner}/{repo}/blob/main/{filename}",
+                        type='changelog',
+                        version_range=f"{old_version} -> {new_version}",
+                        description=f"Changelog file from repository",
+                        source='github'
+                    )]
             except Exception:
-                pass
-                
+                continue
+        return []
+
+    async def _fetch_migration_docs(
+        self,
+        owner: str,
+        repo: str,
+        old_version: str,
+        new_version: str
+    ) -> List[MigrationResource]:
+        """Look for migration guides in the repository's docs directory."""
+        resources = []
+        docs_url = f"https://api.github.com/repos/{owner}/{repo}/contents/docs"
+        try:
+            response = await self._client.get(docs_url)
+            if response.status_code == 200:
+                docs_files = response.json()
+                for file_info in docs_files:
+                    filename = file_info.get('name', '').lower()
+                    if any(keyword in filename for keyword in ['migration', 'upgrade', 'breaking']):
+                        resources.append(MigrationResource(
+                            title=f"Migration Guide: {file_info.get('name')}",
+                            url=file_info.get('html_url', ''),
+                            type='official_guide',
+                            version_range=f"{old_version} -> {new_version}",
+                            description="Migration documentation from repository",
+                            source='github'
+                        ))
         except Exception:
-            pass  # Don't fail if GitHub search fails
-        
+            pass
         return resources
 
+    async def _paginate(self, url: str) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield pages of a paginated GitHub API listing until it is exhausted."""
+        page = 1
+        while True:
+            response = await self._client.get(url, params={'per_page': GITHUB_PAGE_SIZE, 'page': page})
+            if response.status_code != 200:
+                return
+            items = response.json()
+            if not items:
+                return
+            yield items
+            if len(items) < GITHUB_PAGE_SIZE:
+                return
+            page += 1
+
     async def _find_readthedocs_resources(self, readthedocs_url: Optional[str]) -> List[MigrationResource]:
         """Find migration resources from ReadTheDocs documentation."""
         if not readthedocs_url:
@@ -407,17 +509,8 @@ class MigrationGuideFinder:
 
     def _categorize_resource(self, resource: MigrationResource, resources: MigrationResources) -> None:
         """Categorize a migration resource into the appropriate list."""
-        if resource.type == 'official_guide':
-            resources.official_guides.append(resource)
-        elif resource.type == 'changelog':
-            resources.changelogs.append(resource)
-        elif resource.type == 'community_guide':
-            resources.community_resources.append(resource)
-        elif resource.type == 'documentation':
-            resources.documentation_links.append(resource)
-        else:
-            # Default to documentation links for unknown types
-            resources.documentation_links.append(resource)
+        category = RESOURCE_CATEGORIES.get(resource.type, 'documentation_links')
+        getattr(resources, category).append(resource)
 
     def _is_version_relevant(self, tag_name: str, old_version: str, new_version: str) -> bool:
         """Check if a version tag is relevant for the migration."""
@@ -432,6 +525,16 @@ class MigrationGuideFinder:
         # comparison could be added here using packaging.version
         return True
 
+    def _parse_tag_version(self, tag_name: str) -> Optional[Version]:
+        """Parse the version embedded in a release tag (e.g. 'v2.0.0'), if any."""
+        match = re.search(r'(\d+(?:\.\d+)*)', tag_name)
+        if not match:
+            return None
+        try:
+            return Version(match.group(1))
+        except InvalidVersion:
+            return None
+
     async def close(self) -> None:
         """Close the HTTP client."""
         await self._client.aclose()
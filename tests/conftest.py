@@ -2,10 +2,13 @@
 
 import tempfile
 from pathlib import Path
-from unittest.mock import Mock
+from unittest.mock import MagicMock, Mock
 
 import pytest
+from mcp_server.migration_analyzer import MigrationAnalyzer
 from mcp_server.models import Dependency, PackageInfo, ProjectInfo
+from mcp_server.package_manager import PackageManager
+from mcp_server.project_analyzer import ProjectAnalyzer
 
 
 @pytest.fixture
@@ -199,4 +202,45 @@ def mock_search_html():
             </a>
         </body>
     </html>
-    '''
\ No newline at end of file
+    '''
+
+
+# Spec'd stand-ins for the mcp_server.server singletons, built once per session and
+# reset before each test that patches them in.
+@pytest.fixture(scope="session")
+def _analyzer_proto():
+    return MagicMock(spec=ProjectAnalyzer)
+
+
+@pytest.fixture(scope="session")
+def _pkg_proto():
+    return MagicMock(spec=PackageManager)
+
+
+@pytest.fixture(scope="session")
+def _migration_analyzer_proto():
+    return MagicMock(spec=MigrationAnalyzer)
+
+
+def _patch_singleton(monkeypatch, name, proto):
+    proto.reset_mock(return_value=True, side_effect=True)
+    monkeypatch.setattr(f"mcp_server.server.{name}", proto)
+    return proto
+
+
+@pytest.fixture
+def mock_analyzer(monkeypatch, _analyzer_proto):
+    """Patch the server's ProjectAnalyzer singleton with a freshly reset mock."""
+    return _patch_singleton(monkeypatch, "_analyzer", _analyzer_proto)
+
+
+@pytest.fixture
+def mock_pkg(monkeypatch, _pkg_proto):
+    """Patch the server's PackageManager singleton with a freshly reset mock."""
+    return _patch_singleton(monkeypatch, "_pkg", _pkg_proto)
+
+
+@pytest.fixture
+def mock_migration_analyzer(monkeypatch, _migration_analyzer_proto):
+    """Patch the server's MigrationAnalyzer singleton with a freshly reset mock."""
+    return _patch_singleton(monkeypatch, "_migration_analyzer", _migration_analyzer_proto)
@@ -306,6 +306,23 @@ class TestMigrationAnalyzer:
         # Should only call extractor once (second call uses disk cache)
         mock_api_extractor.extract_from_package.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_disk_cache_none_timestamp(self, migration_analyzer, sample_api_surface):
+        """Test that a disk cache entry saved without a timestamp is served, then ages out by mtime."""
+        assert sample_api_surface.extraction_timestamp is None
+        await migration_analyzer._save_cached_api_surface(sample_api_surface)
+        
+        # A fresh entry is a hit even though it carries no timestamp
+        cached = await migration_analyzer._load_cached_api_surface("test_package", "1.0.0")
+        assert cached is not None
+        assert [f.name for f in cached.functions] == ["test_function"]
+        
+        # Once the file is older than the 24 hour limit, the entry expires
+        filename = migration_analyzer._get_cache_filename("api_surface", "test_package", "1.0.0")
+        stale = time.time() - 25 * 3600
+        os.utime(filename, (stale, stale))
+        assert await migration_analyzer._load_cached_api_surface("test_package", "1.0.0") is None
+
     @pytest.mark.asyncio
     async def test_cleanup(self, migration_analyzer, mock_api_extractor, mock_migration_finder):
         """Test cleanup functionality."""
@@ -1,8 +1,9 @@
 """Tests for migration guide finder functionality."""
 
+import asyncio
+
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
-import httpx
 
 from mcp_server.migration_guide_finder import MigrationGuideFinder
 from mcp_server.migration_models import MigrationResource, MigrationResources
@@ -71,30 +72,30 @@ def mock_pypi_project_data():
 class TestMigrationGuideFinder:
     """Test cases for MigrationGuideFinder class."""
 
-    @pytest.mark.asyncio
     async def test_find_migration_resources_basic(self, mock_package_manager, sample_package_info):
         """Test basic migration resource discovery."""
         mock_package_manager.get_package_info.return_value = sample_package_info
         
         finder = MigrationGuideFinder(package_manager=mock_package_manager)
         
-        with patch.object(finder, '_client') as mock_client:
-            # Mock all async methods to return empty lists
-            with patch.object(finder, '_find_github_resources', return_value=[]):
-                with patch.object(finder, '_find_readthedocs_resources', return_value=[]):
-                    with patch.object(finder, '_find_pypi_resources', return_value=[]):
-                        with patch.object(finder, '_find_changelog_resources', return_value=[]):
-                            with patch.object(finder, '_find_fallback_resources') as mock_fallback:
-                                mock_fallback.return_value = [
-                                    MigrationResource(
-                                        title="PyPI Project Page",
-                                        url="https://pypi.org/project/test-package/",
-                                        type="documentation",
-                                        source="pypi"
-                                    )
-                                ]
-                                
-                                result = await finder.find_migration_resources("test-package", "1.0.0", "2.0.0")
+        fallback = [
+            MigrationResource(
+                title="PyPI Project Page",
+                url="https://pypi.org/project/test-package/",
+                type="documentation",
+                source="pypi"
+            )
+        ]
+        
+        with patch.multiple(
+            finder,
+            _find_github_resources=AsyncMock(return_value=[]),
+            _find_readthedocs_resources=AsyncMock(return_value=[]),
+            _find_pypi_resources=AsyncMock(return_value=[]),
+            _find_changelog_resources=AsyncMock(return_value=[]),
+            _find_fallback_resources=AsyncMock(return_value=fallback),
+        ):
+            result = await finder.find_migration_resources("test-package", "1.0.0", "2.0.0")
         
         assert isinstance(result, MigrationResources)
         assert result.package_name == "test-package"
@@ -102,7 +103,6 @@ class TestMigrationGuideFinder:
         assert len(result.documentation_links) == 1
         assert result.documentation_links[0].title == "PyPI Project Page"
 
-    @pytest.mark.asyncio
     async def test_extract_urls_from_metadata(self, mock_package_manager, sample_package_info):
         """Test URL extraction from package metadata."""
         mock_package_manager.get_package_info.return_value = sample_package_info
@@ -124,7 +124,6 @@ class TestMigrationGuideFinder:
         assert "changelog" in urls
         assert urls["github"] == "https://github.com/test/test-package"
 
-    @pytest.mark.asyncio
     async def test_find_github_resources(self, mock_package_manager):
         """Test GitHub resource discovery."""
         finder = MigrationGuideFinder(package_manager=mock_package_manager)
@@ -134,27 +133,93 @@ class TestMigrationGuideFinder:
         mock_releases_response.status_code = 200
         mock_releases_response.json.return_value = [
             {
-                "tag_name": "v2.0.0",
-                "name": "Version 2.0.0",
-                "html_url": "https://github.com/test/test-package/releases/tag/v2.0.0"
+                "tag_name": f"v{version}",
+                "name": f"Version {version}",
+                "html_url": f"https://github.com/test/test-package/releases/tag/v{version}"
             }
+            for version in ("3.0.0", "2.0.0", "1.0.0")
         ]
         
         mock_changelog_response = Mock()
         mock_changelog_response.status_code = 200
         
-        with patch.object(finder._client, 'get') as mock_get:
+        is_relevant = Mock(wraps=finder._is_version_relevant)
+        with patch.object(finder._client, 'get') as mock_get, \
+                patch.object(finder, '_is_version_relevant', is_relevant):
             mock_get.side_effect = [mock_releases_response, mock_changelog_response]
             
             resources = await finder._find_github_resources(
                 "https://github.com/test/test-package", "1.0.0", "2.0.0"
             )
         
+        # v3.0.0 (> new_version) and v1.0.0 (== old_version) are skipped before the relevance check
+        assert is_relevant.call_count == 1
+        release_titles = {r.title for r in resources if r.title.startswith("Release")}
+        assert release_titles == {"Release v2.0.0"}
         assert len(resources) >= 1
         assert any(r.type == "changelog" for r in resources)
         assert any("github" in r.source for r in resources)
 
-    @pytest.mark.asyncio
+    async def test_find_github_resources_out_of_order_backport(self, mock_package_manager):
+        """Test that a backport release listed among newer ones does not end the walk."""
+        finder = MigrationGuideFinder(package_manager=mock_package_manager)
+        
+        # GitHub lists releases by creation date: v1.10.13 shipped after v2.3.0
+        mock_releases_response = Mock()
+        mock_releases_response.status_code = 200
+        mock_releases_response.json.return_value = [
+            {
+                "tag_name": tag,
+                "name": f"Version {tag}",
+                "html_url": f"https://github.com/test/test-package/releases/tag/{tag}"
+            }
+            for tag in ("v2.3.0", "v1.10.13", "v2.2.0", "v2.1.0", "v2.0.0")
+        ]
+        
+        mock_changelog_response = Mock()
+        mock_changelog_response.status_code = 404
+        
+        with patch.object(finder._client, 'get') as mock_get:
+            mock_get.side_effect = [mock_releases_response, mock_changelog_response]
+            
+            resources = await finder._find_github_resources(
+                "https://github.com/test/test-package", "2.0.0", "2.5.0"
+            )
+        
+        release_titles = {r.title for r in resources if r.title.startswith("Release")}
+        assert release_titles == {"Release v2.3.0", "Release v2.2.0", "Release v2.1.0"}
+
+    async def test_fetch_releases_stops_after_page_older_than_range(self, mock_package_manager):
+        """Test that paging stops once a whole page predates old_version."""
+        finder = MigrationGuideFinder(package_manager=mock_package_manager)
+        
+        def page(*versions):
+            response = Mock()
+            response.status_code = 200
+            response.json.return_value = [
+                {
+                    "tag_name": f"v{version}",
+                    "name": f"Version {version}",
+                    "html_url": f"https://github.com/test/test-package/releases/tag/v{version}"
+                }
+                for version in versions
+            ]
+            return response
+        
+        pages = [
+            page("5.0.0", "4.0.0", "3.1.0"),
+            page("2.9.0", "2.8.0", "2.7.0"),
+            page("2.6.0", "2.5.0", "2.4.0"),
+        ]
+        
+        with patch('mcp_server.migration_guide_finder.GITHUB_PAGE_SIZE', 3), \
+                patch.object(finder._client, 'get', side_effect=pages) as mock_get:
+            resources = await finder._fetch_releases("test", "test-package", "3.0.0", "4.0.0")
+        
+        # The second page has nothing above 3.0.0, so the third is never requested
+        assert mock_get.call_count == 2
+        assert [r.title for r in resources] == ["Release v4.0.0", "Release v3.1.0"]
+
     async def test_find_readthedocs_resources(self, mock_package_manager):
         """Test ReadTheDocs resource discovery."""
         finder = MigrationGuideFinder(package_manager=mock_package_manager)
@@ -169,7 +234,6 @@ class TestMigrationGuideFinder:
         assert len(resources) >= 1
         assert any(r.source == "readthedocs" for r in resources)
 
-    @pytest.mark.asyncio
     async def test_find_pypi_resources(self, mock_package_manager, mock_pypi_project_data):
         """Test PyPI resource discovery."""
         mock_package_manager.client.get_project.return_value = mock_pypi_project_data
@@ -182,7 +246,6 @@ class TestMigrationGuideFinder:
         changelog_resources = [r for r in resources if r.type == "changelog"]
         assert len(changelog_resources) >= 1
 
-    @pytest.mark.asyncio
     async def test_find_fallback_resources(self, mock_package_manager):
         """Test fallback resource discovery."""
         finder = MigrationGuideFinder(package_manager=mock_package_manager)
@@ -194,7 +257,6 @@ class TestMigrationGuideFinder:
         assert any("github.com/search" in r.url for r in resources)
         assert any("stackoverflow.com" in r.url for r in resources)
 
-    @pytest.mark.asyncio
     async def test_categorize_resource(self, mock_package_manager):
         """Test resource categorization."""
         finder = MigrationGuideFinder(package_manager=mock_package_manager)
@@ -210,14 +272,20 @@ class TestMigrationGuideFinder:
         community = MigrationResource(
             title="Community Guide", url="http://example.com", type="community_guide", source="github"
         )
+        blog_post = MigrationResource(
+            title="Blog Post", url="http://example.com", type="blog_post", source="community"
+        )
         
         finder._categorize_resource(official_guide, resources)
         finder._categorize_resource(changelog, resources)
         finder._categorize_resource(community, resources)
+        finder._categorize_resource(blog_post, resources)
         
         assert len(resources.official_guides) == 1
         assert len(resources.changelogs) == 1
         assert len(resources.community_resources) == 1
+        # Unknown types fall through to documentation links
+        assert resources.documentation_links == [blog_post]
 
     def test_is_version_relevant(self, mock_package_manager):
         """Test version relevance checking."""
@@ -227,7 +295,6 @@ class TestMigrationGuideFinder:
         assert finder._is_version_relevant("2.1.0", "1.0.0", "2.0.0")
         assert not finder._is_version_relevant("invalid-tag", "1.0.0", "2.0.0")
 
-    @pytest.mark.asyncio
     async def test_error_handling(self, mock_package_manager):
         """Test error handling in migration resource discovery."""
         mock_package_manager.get_package_info.side_effect = Exception("Package not found")
@@ -237,33 +304,57 @@ class TestMigrationGuideFinder:
         with pytest.raises(MigrationResourceError):
             await finder.find_migration_resources("nonexistent-package", "1.0.0", "2.0.0")
 
-    @pytest.mark.asyncio
     async def test_network_error_graceful_handling(self, mock_package_manager, sample_package_info):
         """Test graceful handling of network errors."""
         mock_package_manager.get_package_info.return_value = sample_package_info
         
         finder = MigrationGuideFinder(package_manager=mock_package_manager)
         
+        fallback = [
+            MigrationResource(
+                title="Fallback", url="http://example.com", 
+                type="documentation", source="fallback"
+            )
+        ]
+        
         # Mock network failures for individual sources
-        with patch.object(finder, '_find_github_resources', side_effect=Exception("Network error")):
-            with patch.object(finder, '_find_readthedocs_resources', return_value=[]):
-                with patch.object(finder, '_find_pypi_resources', return_value=[]):
-                    with patch.object(finder, '_find_changelog_resources', return_value=[]):
-                        with patch.object(finder, '_find_fallback_resources') as mock_fallback:
-                            mock_fallback.return_value = [
-                                MigrationResource(
-                                    title="Fallback", url="http://example.com", 
-                                    type="documentation", source="fallback"
-                                )
-                            ]
-                            
-                            result = await finder.find_migration_resources("test-package", "1.0.0", "2.0.0")
+        with patch.multiple(
+            finder,
+            _find_github_resources=AsyncMock(side_effect=Exception("Network error")),
+            _find_readthedocs_resources=AsyncMock(return_value=[]),
+            _find_pypi_resources=AsyncMock(return_value=[]),
+            _find_changelog_resources=AsyncMock(return_value=[]),
+            _find_fallback_resources=AsyncMock(return_value=fallback),
+        ):
+            result = await finder.find_migration_resources("test-package", "1.0.0", "2.0.0")
         
         # Should still return results despite GitHub failure
         assert isinstance(result, MigrationResources)
         assert len(result.documentation_links) == 1
 
-    @pytest.mark.asyncio
+    async def test_slow_source_does_not_stall_discovery(self, mock_package_manager, sample_package_info):
+        """Test that a hung source is cancelled at the deadline and the rest are kept."""
+        mock_package_manager.get_package_info.return_value = sample_package_info
+        
+        finder = MigrationGuideFinder(package_manager=mock_package_manager)
+        changelog = MigrationResource(
+            title="Changelog", url="http://example.com", type="changelog", source="pypi"
+        )
+        
+        async def hang(*args, **kwargs):
+            await asyncio.sleep(60)
+        
+        with patch('mcp_server.migration_guide_finder.DISCOVERY_TIMEOUT', 0.05), patch.multiple(
+            finder,
+            _find_github_resources=AsyncMock(side_effect=hang),
+            _find_readthedocs_resources=AsyncMock(return_value=[]),
+            _find_pypi_resources=AsyncMock(return_value=[changelog]),
+            _find_changelog_resources=AsyncMock(return_value=[]),
+        ):
+            result = await finder.find_migration_resources("test-package", "1.0.0", "2.0.0")
+        
+        assert result.changelogs == [changelog]
+
     async def test_context_manager(self, mock_package_manager):
         """Test async context manager functionality."""
         async with MigrationGuideFinder(package_manager=mock_package_manager) as finder:
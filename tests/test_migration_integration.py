@@ -1,510 +1,539 @@
 """Integration tests for complete migration analysis workflows."""
 
 import asyncio
-import tempfile
-from unittest.mock import Mock, AsyncMock, patch
+import functools
+from pathlib import Path
+from unittest.mock import Mock, AsyncMock
 import pytest
-import httpx
 
+from mcp_server.api_surface_extractor import APISurfaceExtractor
 from mcp_server.migration_analyzer import MigrationAnalyzer
+from mcp_server.migration_guide_finder import MigrationGuideFinder
 from mcp_server.migration_models import (
-    APIElement, APISurface, APIChange, VersionComparison,
-    MigrationResource, MigrationResources
+    APIElement, APISurface, MigrationResource, MigrationResources
 )
-from mcp_server.package_manager import PackageManager
+from mcp_server.package_manager import LocalMetadataExtractor, PackageManager, PyPIClient
 from mcp_server.models import PackageInfo
 
 
+# Read-only API surfaces shared across tests
+_OLD_REQUESTS_API = APISurface(
+    package_name="requests",
+    version="2.25.0",
+    functions=[
+        APIElement(
+            name="get",
+            type="function",
+            signature="def get(url, params=None, **kwargs)",
+            docstring="Sends a GET request."
+        ),
+        APIElement(
+            name="post",
+            type="function",
+            signature="def post(url, data=None, json=None, **kwargs)",
+            docstring="Sends a POST request."
+        ),
+        APIElement(
+            name="request",
+            type="function",
+            signature="def request(method, url, **kwargs)",
+            docstring="Constructs and sends a Request."
+        )
+    ],
+    classes=[
+        APIElement(
+            name="Session",
+            type="class",
+            signature="class Session",
+            docstring="A Requests session."
+        ),
+        APIElement(
+            name="Response",
+            type="class",
+            signature="class Response",
+            docstring="The Response object."
+        )
+    ],
+    constants=[
+        APIElement(
+            name="__version__",
+            type="constant",
+            signature="__version__ = '2.25.0'",
+            docstring="Version string."
+        )
+    ]
+)
+
+_NEW_REQUESTS_API = APISurface(
+    package_name="requests",
+    version="2.28.0",
+    functions=[
+        APIElement(
+            name="get",
+            type="function",
+            signature="def get(url, params=None, **kwargs)",
+            docstring="Sends a GET request."
+        ),
+        APIElement(
+            name="post",
+            type="function",
+            signature="def post(url, data=None, json=None, **kwargs)",
+            docstring="Sends a POST request."
+        ),
+        APIElement(
+            name="request",
+            type="function",
+            signature="def request(method, url, **kwargs)",
+            docstring="Constructs and sends a Request."
+        )
+    ],
+    classes=[
+        APIElement(
+            name="Session",
+            type="class",
+            signature="class Session",
+            docstring="A Requests session."
+        ),
+        APIElement(
+            name="Response",
+            type="class",
+            signature="class Response",
+            docstring="The Response object."
+        ),
+        APIElement(
+            name="PreparedRequest",
+            type="class",
+            signature="class PreparedRequest",
+            docstring="The fully mutable PreparedRequest object."
+        )
+    ],
+    constants=[
+        APIElement(
+            name="__version__",
+            type="constant",
+            signature="__version__ = '2.28.0'",
+            docstring="Version string."
+        )
+    ]
+)
+
+# Django 3.2 still carries deprecated features that 4.0 removes
+_DJANGO_3_API = APISurface(
+    package_name="Django",
+    version="3.2.0",
+    functions=[
+        APIElement(
+            name="url",
+            type="function",
+            signature="def url(regex, view, kwargs=None, name=None)",
+            docstring="DEPRECATED: Use path() or re_path() instead.",
+            is_deprecated=True,
+            deprecation_message="Use path() or re_path() instead"
+        )
+    ],
+    classes=[
+        APIElement(
+            name="Model",
+            type="class",
+            signature="class Model(metaclass=ModelBase)",
+            docstring="Base class for all Django models."
+        ),
+        APIElement(
+            name="HttpRequest",
+            type="class",
+            signature="class HttpRequest",
+            docstring="Represents an HTTP request."
+        )
+    ]
+)
+
+_DJANGO_4_API = APISurface(
+    package_name="Django",
+    version="4.0.0",
+    functions=[
+        # url() function removed (breaking change)
+    ],
+    classes=[
+        APIElement(
+            name="Model",
+            type="class",
+            signature="class Model(metaclass=ModelBase)",
+            docstring="Base class for all Django models."
+        ),
+        APIElement(
+            name="HttpRequest",
+            type="class",
+            signature="class HttpRequest",
+            docstring="Represents an HTTP request."
+        ),
+        APIElement(
+            name="AsyncHttpRequest",
+            type="class",
+            signature="class AsyncHttpRequest(HttpRequest)",
+            docstring="Async version of HttpRequest."
+        )
+    ]
+)
+
+_NUMPY_OLD_API = APISurface(
+    package_name="numpy",
+    version="1.19.0",
+    functions=[
+        APIElement(
+            name="array",
+            type="function",
+            signature="def array(object, dtype=None, copy=True, order='K', subok=False, ndmin=0)",
+            docstring="Create an array."
+        ),
+        APIElement(
+            name="sum",
+            type="function",
+            signature="def sum(a, axis=None, dtype=None, out=None, keepdims=False)",
+            docstring="Sum of array elements over a given axis."
+        ),
+        APIElement(
+            name="matrix",
+            type="function",
+            signature="def matrix(data, dtype=None, copy=True)",
+            docstring="DEPRECATED: Use array instead.",
+            is_deprecated=True,
+            deprecation_message="matrix is deprecated, use array instead"
+        )
+    ],
+    classes=[
+        APIElement(
+            name="ndarray",
+            type="class",
+            signature="class ndarray",
+            docstring="N-dimensional array object."
+        ),
+        APIElement(
+            name="matrix",
+            type="class",
+            signature="class matrix(ndarray)",
+            docstring="DEPRECATED matrix class.",
+            is_deprecated=True,
+            deprecation_message="matrix class is deprecated"
+        )
+    ]
+)
+
+_NUMPY_NEW_API = APISurface(
+    package_name="numpy",
+    version="1.21.0",
+    functions=[
+        APIElement(
+            name="array",
+            type="function",
+            signature="def array(object, dtype=None, copy=True, order='K', subok=False, ndmin=0, like=None)",
+            docstring="Create an array."
+        ),
+        APIElement(
+            name="sum",
+            type="function",
+            signature="def sum(a, axis=None, dtype=None, out=None, keepdims=False, initial=None, where=True)",
+            docstring="Sum of array elements over a given axis."
+        ),
+        # matrix function removed (breaking change)
+    ],
+    classes=[
+        APIElement(
+            name="ndarray",
+            type="class",
+            signature="class ndarray",
+            docstring="N-dimensional array object."
+        ),
+        # matrix class removed (breaking change)
+    ]
+)
+
+
+# Package metadata and migration resources returned by mocked collaborators
+_REQUESTS_PKG_INFO = PackageInfo(
+    name="requests",
+    version="2.28.0",
+    description="Python HTTP for Humans.",
+    homepage="https://requests.readthedocs.io",
+    repository="https://github.com/psf/requests",
+    dependencies=[]
+)
+
+_REQUESTS_MIGRATION_RES = MigrationResources(
+    package_name="requests",
+    version_range="2.25.0 -> 2.28.0",
+    changelogs=[
+        MigrationResource(
+            title="Requests Changelog",
+            url="https://github.com/psf/requests/blob/main/HISTORY.md",
+            type="changelog",
+            source="github"
+        )
+    ],
+    official_guides=[
+        MigrationResource(
+            title="Requests Documentation",
+            url="https://requests.readthedocs.io/en/latest/",
+            type="official_guide",
+            source="readthedocs"
+        )
+    ]
+)
+
+_DJANGO_PKG_INFO = PackageInfo(
+    name="Django",
+    version="4.0.0",
+    description="A high-level Python Web framework.",
+    homepage="https://www.djangoproject.com/",
+    repository="https://github.com/django/django",
+    dependencies=[]
+)
+
+_DJANGO_MIGRATION_RES = MigrationResources(
+    package_name="Django",
+    version_range="3.2.0 -> 4.0.0",
+    official_guides=[
+        MigrationResource(
+            title="Django 4.0 Release Notes",
+            url="https://docs.djangoproject.com/en/4.0/releases/4.0/",
+            type="official_guide",
+            source="official_docs"
+        ),
+        MigrationResource(
+            title="Upgrading Django",
+            url="https://docs.djangoproject.com/en/4.0/howto/upgrade-version/",
+            type="official_guide",
+            source="official_docs"
+        )
+    ],
+    changelogs=[
+        MigrationResource(
+            title="Django GitHub Releases",
+            url="https://github.com/django/django/releases/tag/4.0",
+            type="changelog",
+            source="github"
+        )
+    ],
+    community_resources=[
+        MigrationResource(
+            title="Django 4.0 Migration Guide",
+            url="https://example.com/django-4-migration",
+            type="community_guide",
+            source="community"
+        )
+    ]
+)
+
+_NUMPY_PKG_INFO = PackageInfo(
+    name="numpy",
+    version="1.21.0",
+    description="Fundamental package for array computing in Python",
+    homepage="https://numpy.org",
+    repository="https://github.com/numpy/numpy",
+    dependencies=[]
+)
+
+_NUMPY_MIGRATION_RES = MigrationResources(
+    package_name="numpy",
+    version_range="1.19.0 -> 1.21.0",
+    official_guides=[
+        MigrationResource(
+            title="NumPy 1.21.0 Release Notes",
+            url="https://numpy.org/doc/stable/release/1.21.0-notes.html",
+            type="official_guide",
+            source="official_docs"
+        )
+    ],
+    changelogs=[
+        MigrationResource(
+            title="NumPy Changelog",
+            url="https://github.com/numpy/numpy/releases/tag/v1.21.0",
+            type="changelog",
+            source="github"
+        )
+    ]
+)
+
+# Payloads for the concurrent workflow; side_effect consumes its list, so tests copy these.
+# The builders are memoized so repeated (package, version) pairs share one instance.
+_CONCURRENT_PACKAGES = [
+    ("requests", "2.25.0", "2.28.0"),
+    ("flask", "1.1.0", "2.0.0"),
+    ("pandas", "1.2.0", "1.3.0")
+]
+
+
+@functools.lru_cache(maxsize=None)
+def _make_concurrent_api(pkg_name, version):
+    return APISurface(
+        package_name=pkg_name,
+        version=version,
+        functions=[
+            APIElement(
+                name=f"{pkg_name}_func",
+                type="function",
+                signature=f"def {pkg_name}_func() -> None",
+                docstring=f"Function from {pkg_name}"
+            )
+        ]
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _make_concurrent_resources(pkg_name, old_ver, new_ver):
+    return MigrationResources(
+        package_name=pkg_name,
+        version_range=f"{old_ver} -> {new_ver}",
+        documentation_links=[
+            MigrationResource(
+                title=f"{pkg_name} Documentation",
+                url=f"https://{pkg_name}.readthedocs.io",
+                type="documentation",
+                source="readthedocs"
+            )
+        ]
+    )
+
+
+_CONCURRENT_API_CALLS = [
+    _make_concurrent_api(pkg, version)
+    for pkg, old_ver, new_ver in _CONCURRENT_PACKAGES
+    for version in (old_ver, new_ver)
+]
+_CONCURRENT_RESOURCE_CALLS = [
+    _make_concurrent_resources(pkg, old_ver, new_ver) for pkg, old_ver, new_ver in _CONCURRENT_PACKAGES
+]
+
+
 class TestMigrationIntegration:
     """Integration tests for complete migration analysis workflows."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def real_package_manager(self):
-        """Create a PackageManager with mocked external dependencies."""
-        manager = PackageManager()
-        
-        # Mock the PyPI client
-        manager.client.get_project = Mock()
-        manager.client.search = Mock()
-        
-        # Mock local metadata extractor
-        manager.local.is_package_installed = Mock(return_value=False)
-        manager.local.get_local_package_info = Mock()
-        
-        return manager
+        """Create a PackageManager shared by the module; mocks are rebound per test."""
+        return PackageManager()
 
-    @pytest.fixture
-    def integration_analyzer(self, real_package_manager):
+    @pytest.fixture(scope="module")
+    def integration_analyzer(self, real_package_manager, tmp_path_factory):
         """Create a MigrationAnalyzer for integration testing."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            analyzer = MigrationAnalyzer(
-                package_manager=real_package_manager,
-                cache_dir=temp_dir,
-                timeout=15.0
-            )
-            yield analyzer
-
-    @pytest.mark.asyncio
-    async def test_requests_migration_scenario(self, integration_analyzer):
-        """Test realistic migration scenario for requests library."""
-        # Mock package info
-        package_info = PackageInfo(
-            name="requests",
-            version="2.28.0",
-            description="Python HTTP for Humans.",
-            homepage="https://requests.readthedocs.io",
-            repository="https://github.com/psf/requests",
-            dependencies=[]
-        )
-        integration_analyzer.package_manager.get_package_info = Mock(return_value=package_info)
-        
-        # Mock API surfaces for requests 2.25.0 vs 2.28.0
-        old_requests_api = APISurface(
-            package_name="requests",
-            version="2.25.0",
-            functions=[
-                APIElement(
-                    name="get",
-                    type="function",
-                    signature="def get(url, params=None, **kwargs)",
-                    docstring="Sends a GET request."
-                ),
-                APIElement(
-                    name="post",
-                    type="function",
-                    signature="def post(url, data=None, json=None, **kwargs)",
-                    docstring="Sends a POST request."
-                ),
-                APIElement(
-                    name="request",
-                    type="function",
-                    signature="def request(method, url, **kwargs)",
-                    docstring="Constructs and sends a Request."
-                )
-            ],
-            classes=[
-                APIElement(
-                    name="Session",
-                    type="class",
-                    signature="class Session",
-                    docstring="A Requests session."
-                ),
-                APIElement(
-                    name="Response",
-                    type="class",
-                    signature="class Response",
-                    docstring="The Response object."
-                )
-            ],
-            constants=[
-                APIElement(
-                    name="__version__",
-                    type="constant",
-                    signature="__version__ = '2.25.0'",
-                    docstring="Version string."
-                )
-            ]
+        return MigrationAnalyzer(
+            package_manager=real_package_manager,
+            cache_dir=str(tmp_path_factory.mktemp("cache")),
+            timeout=15.0
         )
+
+    @pytest.fixture(autouse=True)
+    def isolate_analyzer(self, integration_analyzer):
+        """Give each test fresh external mocks and empty memory and disk caches."""
+        manager = integration_analyzer.package_manager
         
-        new_requests_api = APISurface(
-            package_name="requests",
-            version="2.28.0",
-            functions=[
-                APIElement(
-                    name="get",
-                    type="function",
-                    signature="def get(url, params=None, **kwargs)",
-                    docstring="Sends a GET request."
-                ),
-                APIElement(
-                    name="post",
-                    type="function",
-                    signature="def post(url, data=None, json=None, **kwargs)",
-                    docstring="Sends a POST request."
-                ),
-                APIElement(
-                    name="request",
-                    type="function",
-                    signature="def request(method, url, **kwargs)",
-                    docstring="Constructs and sends a Request."
-                )
-            ],
-            classes=[
-                APIElement(
-                    name="Session",
-                    type="class",
-                    signature="class Session",
-                    docstring="A Requests session."
-                ),
-                APIElement(
-                    name="Response",
-                    type="class",
-                    signature="class Response",
-                    docstring="The Response object."
-                ),
-                APIElement(
-                    name="PreparedRequest",
-                    type="class",
-                    signature="class PreparedRequest",
-                    docstring="The fully mutable PreparedRequest object."
-                )
-            ],
-            constants=[
-                APIElement(
-                    name="__version__",
-                    type="constant",
-                    signature="__version__ = '2.28.0'",
-                    docstring="Version string."
-                )
-            ]
-        )
+        # Mock the PyPI client
+        manager.client.get_project = Mock(spec=PyPIClient.get_project)
+        manager.client.search = Mock(spec=PyPIClient.search)
         
-        # Mock API extraction - return appropriate API based on version
-        async def mock_extract(package_name, version):
-            if version == "2.25.0":
-                return old_requests_api
-            elif version == "2.28.0":
-                return new_requests_api
-            else:
-                return new_requests_api  # Default to new API
-        
-        integration_analyzer.api_extractor.extract_from_package = mock_extract
-        
-        # Mock migration resources
-        migration_resources = MigrationResources(
-            package_name="requests",
-            version_range="2.25.0 -> 2.28.0",
-            changelogs=[
-                MigrationResource(
-                    title="Requests Changelog",
-                    url="https://github.com/psf/requests/blob/main/HISTORY.md",
-                    type="changelog",
-                    source="github"
-                )
-            ],
-            official_guides=[
-                MigrationResource(
-                    title="Requests Documentation",
-                    url="https://requests.readthedocs.io/en/latest/",
-                    type="official_guide",
-                    source="readthedocs"
-                )
-            ]
+        # Mock local metadata extractor
+        manager.local.is_package_installed = Mock(
+            spec=LocalMetadataExtractor.is_package_installed, return_value=False
         )
+        manager.local.get_local_package_info = Mock(spec=LocalMetadataExtractor.get_local_package_info)
         
+        # Migration discovery is configured per test via return_value/side_effect
         integration_analyzer.migration_finder.find_migration_resources = AsyncMock(
-            return_value=migration_resources
+            spec=MigrationGuideFinder.find_migration_resources
         )
         
-        # Perform complete migration analysis
-        api_analysis = await integration_analyzer.analyze_api_surface("requests", "2.28.0")
-        version_comparison = await integration_analyzer.compare_versions("requests", "2.25.0", "2.28.0")
-        migration_info = await integration_analyzer.find_migration_resources("requests", "2.25.0", "2.28.0")
-        
-        # Verify API analysis
-        assert api_analysis.package_name == "requests"
-        assert api_analysis.version == "2.28.0"
-        assert len(api_analysis.functions) == 3
-        assert len(api_analysis.classes) == 3  # Added PreparedRequest
-        
-        # Verify version comparison
-        assert version_comparison.package_name == "requests"
-        assert version_comparison.old_version == "2.25.0"
-        assert version_comparison.new_version == "2.28.0"
-        assert len(version_comparison.additions) == 1  # PreparedRequest class
+        for cached_file in Path(integration_analyzer.cache_dir).iterdir():
+            cached_file.unlink()
+        integration_analyzer._api_cache.clear()
+        integration_analyzer._comparison_cache.clear()
+        integration_analyzer._resource_cache.clear()
         
-        # Verify migration resources
-        assert migration_info.package_name == "requests"
-        assert len(migration_info.changelogs) == 1
-        assert len(migration_info.official_guides) == 1
-
-    @pytest.mark.asyncio
-    async def test_django_major_version_migration(self, integration_analyzer):
-        """Test migration analysis for a major version change (Django 3.x to 4.x)."""
-        # Mock Django package info
-        package_info = PackageInfo(
-            name="Django",
-            version="4.0.0",
-            description="A high-level Python Web framework.",
-            homepage="https://www.djangoproject.com/",
-            repository="https://github.com/django/django",
-            dependencies=[]
-        )
-        integration_analyzer.package_manager.get_package_info = Mock(return_value=package_info)
-        
-        # Mock Django 3.2 API (with some deprecated features)
-        django_3_api = APISurface(
-            package_name="Django",
-            version="3.2.0",
-            functions=[
-                APIElement(
-                    name="url",
-                    type="function",
-                    signature="def url(regex, view, kwargs=None, name=None)",
-                    docstring="DEPRECATED: Use path() or re_path() instead.",
-                    is_deprecated=True,
-                    deprecation_message="Use path() or re_path() instead"
-                )
-            ],
-            classes=[
-                APIElement(
-                    name="Model",
-                    type="class",
-                    signature="class Model(metaclass=ModelBase)",
-                    docstring="Base class for all Django models."
-                ),
-                APIElement(
-                    name="HttpRequest",
-                    type="class",
-                    signature="class HttpRequest",
-                    docstring="Represents an HTTP request."
-                )
-            ]
-        )
+        yield
         
-        # Mock Django 4.0 API (removed deprecated features, added new ones)
-        django_4_api = APISurface(
-            package_name="Django",
-            version="4.0.0",
-            functions=[
-                # url() function removed (breaking change)
-            ],
-            classes=[
-                APIElement(
-                    name="Model",
-                    type="class",
-                    signature="class Model(metaclass=ModelBase)",
-                    docstring="Base class for all Django models."
-                ),
-                APIElement(
-                    name="HttpRequest",
-                    type="class",
-                    signature="class HttpRequest",
-                    docstring="Represents an HTTP request."
-                ),
-                APIElement(
-                    name="AsyncHttpRequest",
-                    type="class",
-                    signature="class AsyncHttpRequest(HttpRequest)",
-                    docstring="Async version of HttpRequest."
-                )
-            ]
+        # Drop per-test overrides so the next test starts from the real methods
+        vars(manager).pop("get_package_info", None)
+        vars(integration_analyzer.api_extractor).pop("extract_from_package", None)
+        vars(integration_analyzer.migration_finder).pop("find_migration_resources", None)
+
+    @pytest.mark.parametrize(
+        "pkg_info,old_api,new_api,resources,expected",
+        [
+            pytest.param(
+                _REQUESTS_PKG_INFO, _OLD_REQUESTS_API, _NEW_REQUESTS_API, _REQUESTS_MIGRATION_RES,
+                {"additions": {"PreparedRequest"}, "breaking_changes": set(), "modifications": {"__version__"}},
+                id="requests-minor",
+            ),
+            pytest.param(
+                _DJANGO_PKG_INFO, _DJANGO_3_API, _DJANGO_4_API, _DJANGO_MIGRATION_RES,
+                {"additions": {"AsyncHttpRequest"}, "breaking_changes": {"url"}, "modifications": set()},
+                id="django-major",
+            ),
+            pytest.param(
+                _NUMPY_PKG_INFO, _NUMPY_OLD_API, _NUMPY_NEW_API, _NUMPY_MIGRATION_RES,
+                {"additions": set(), "breaking_changes": {"matrix"}, "modifications": {"array", "sum"}},
+                id="numpy-scientific",
+            ),
+        ],
+    )
+    async def test_package_migration_scenario(
+        self, integration_analyzer, pkg_info, old_api, new_api, resources, expected
+    ):
+        """Test the complete migration workflow for realistic package upgrades."""
+        name, old_version, new_version = pkg_info.name, old_api.version, new_api.version
+        integration_analyzer.package_manager.get_package_info = Mock(
+            spec=PackageManager.get_package_info, return_value=pkg_info
         )
         
-        # Mock API extraction
+        # Mock API extraction - return appropriate API based on version
+        api_map = {old_version: old_api, new_version: new_api}
         integration_analyzer.api_extractor.extract_from_package = AsyncMock(
-            side_effect=[django_3_api, django_4_api]
-        )
-        
-        # Mock comprehensive migration resources
-        django_resources = MigrationResources(
-            package_name="Django",
-            version_range="3.2.0 -> 4.0.0",
-            official_guides=[
-                MigrationResource(
-                    title="Django 4.0 Release Notes",
-                    url="https://docs.djangoproject.com/en/4.0/releases/4.0/",
-                    type="official_guide",
-                    source="official_docs"
-                ),
-                MigrationResource(
-                    title="Upgrading Django",
-                    url="https://docs.djangoproject.com/en/4.0/howto/upgrade-version/",
-                    type="official_guide",
-                    source="official_docs"
-                )
-            ],
-            changelogs=[
-                MigrationResource(
-                    title="Django GitHub Releases",
-                    url="https://github.com/django/django/releases/tag/4.0",
-                    type="changelog",
-                    source="github"
-                )
-            ],
-            community_resources=[
-                MigrationResource(
-                    title="Django 4.0 Migration Guide",
-                    url="https://example.com/django-4-migration",
-                    type="community_guide",
-                    source="community"
-                )
-            ]
+            spec=APISurfaceExtractor.extract_from_package,
+            side_effect=lambda package_name, version: api_map[version]
         )
+        integration_analyzer.migration_finder.find_migration_resources.return_value = resources
         
-        integration_analyzer.migration_finder.find_migration_resources = AsyncMock(
-            return_value=django_resources
+        # Perform complete migration analysis; the three calls are independent
+        api_analysis, comparison, migration_info = await asyncio.gather(
+            integration_analyzer.analyze_api_surface(name, new_version),
+            integration_analyzer.compare_versions(name, old_version, new_version),
+            integration_analyzer.find_migration_resources(name, old_version, new_version),
         )
         
-        # Perform migration analysis
-        comparison = await integration_analyzer.compare_versions("Django", "3.2.0", "4.0.0")
-        resources = await integration_analyzer.find_migration_resources("Django", "3.2.0", "4.0.0")
-        
-        # Verify breaking changes detected
-        assert len(comparison.breaking_changes) >= 1
-        breaking_names = {change.element_name for change in comparison.breaking_changes}
-        assert "url" in breaking_names  # Removed deprecated function
-        
-        # Verify additions
-        assert len(comparison.additions) >= 1
-        addition_names = {change.element_name for change in comparison.additions}
-        assert "AsyncHttpRequest" in addition_names
-        
-        # Verify comprehensive migration resources
-        assert len(resources.official_guides) == 2
-        assert len(resources.changelogs) == 1
-        assert len(resources.community_resources) == 1
-
-    @pytest.mark.asyncio
-    async def test_numpy_scientific_package_migration(self, integration_analyzer):
-        """Test migration analysis for a scientific package with complex API."""
-        # Mock NumPy package info
-        package_info = PackageInfo(
-            name="numpy",
-            version="1.21.0",
-            description="Fundamental package for array computing in Python",
-            homepage="https://numpy.org",
-            repository="https://github.com/numpy/numpy",
-            dependencies=[]
-        )
-        integration_analyzer.package_manager.get_package_info = Mock(return_value=package_info)
-        
-        # Mock NumPy API with mathematical functions and array operations
-        numpy_old_api = APISurface(
-            package_name="numpy",
-            version="1.19.0",
-            functions=[
-                APIElement(
-                    name="array",
-                    type="function",
-                    signature="def array(object, dtype=None, copy=True, order='K', subok=False, ndmin=0)",
-                    docstring="Create an array."
-                ),
-                APIElement(
-                    name="sum",
-                    type="function",
-                    signature="def sum(a, axis=None, dtype=None, out=None, keepdims=False)",
-                    docstring="Sum of array elements over a given axis."
-                ),
-                APIElement(
-                    name="matrix",
-                    type="function",
-                    signature="def matrix(data, dtype=None, copy=True)",
-                    docstring="DEPRECATED: Use array instead.",
-                    is_deprecated=True,
-                    deprecation_message="matrix is deprecated, use array instead"
-                )
-            ],
-            classes=[
-                APIElement(
-                    name="ndarray",
-                    type="class",
-                    signature="class ndarray",
-                    docstring="N-dimensional array object."
-                ),
-                APIElement(
-                    name="matrix",
-                    type="class",
-                    signature="class matrix(ndarray)",
-                    docstring="DEPRECATED matrix class.",
-                    is_deprecated=True,
-                    deprecation_message="matrix class is deprecated"
-                )
-            ]
-        )
-        
-        numpy_new_api = APISurface(
-            package_name="numpy",
-            version="1.21.0",
-            functions=[
-                APIElement(
-                    name="array",
-                    type="function",
-                    signature="def array(object, dtype=None, copy=True, order='K', subok=False, ndmin=0, like=None)",
-                    docstring="Create an array."
-                ),
-                APIElement(
-                    name="sum",
-                    type="function",
-                    signature="def sum(a, axis=None, dtype=None, out=None, keepdims=False, initial=None, where=True)",
-                    docstring="Sum of array elements over a given axis."
-                ),
-                # matrix function removed (breaking change)
-            ],
-            classes=[
-                APIElement(
-                    name="ndarray",
-                    type="class",
-                    signature="class ndarray",
-                    docstring="N-dimensional array object."
-                ),
-                # matrix class removed (breaking change)
-            ]
-        )
+        # Verify API analysis
+        assert api_analysis.package_name == name
+        assert api_analysis.version == new_version
+        assert len(api_analysis.functions) == len(new_api.functions)
+        assert len(api_analysis.classes) == len(new_api.classes)
         
-        # Mock API extraction - return appropriate API based on version
-        async def mock_extract_numpy(package_name, version):
-            if version == "1.19.0":
-                return numpy_old_api
-            elif version == "1.21.0":
-                return numpy_new_api
-            else:
-                return numpy_new_api  # Default to new API
-        
-        integration_analyzer.api_extractor.extract_from_package = mock_extract_numpy
-        
-        # Mock NumPy migration resources
-        numpy_resources = MigrationResources(
-            package_name="numpy",
-            version_range="1.19.0 -> 1.21.0",
-            official_guides=[
-                MigrationResource(
-                    title="NumPy 1.21.0 Release Notes",
-                    url="https://numpy.org/doc/stable/release/1.21.0-notes.html",
-                    type="official_guide",
-                    source="official_docs"
-                )
-            ],
-            changelogs=[
-                MigrationResource(
-                    title="NumPy Changelog",
-                    url="https://github.com/numpy/numpy/releases/tag/v1.21.0",
-                    type="changelog",
-                    source="github"
-                )
-            ]
-        )
+        # Verify version comparison
+        assert comparison.package_name == name
+        assert comparison.old_version == old_version
+        assert comparison.new_version == new_version
+        for category, names in expected.items():
+            assert {change.element_name for change in getattr(comparison, category)} == names, category
         
-        integration_analyzer.migration_finder.find_migration_resources = AsyncMock(
-            return_value=numpy_resources
+        # Verify migration resources
+        assert migration_info is resources
+
+    async def test_comparison_cache_hit(self, integration_analyzer):
+        """Test that repeated comparisons are served from the analyzer cache."""
+        api_map = {"1.19.0": _NUMPY_OLD_API, "1.21.0": _NUMPY_NEW_API}
+        integration_analyzer.api_extractor.extract_from_package = AsyncMock(
+            spec=APISurfaceExtractor.extract_from_package,
+            side_effect=lambda package_name, version: api_map[version]
         )
         
-        # Clear any caches to ensure fresh comparison
-        integration_analyzer._comparison_cache.clear()
-        integration_analyzer._api_cache.clear()
-        
-        # Perform migration analysis
-        comparison = await integration_analyzer.compare_versions("numpy", "1.19.0", "1.21.0")
-        
-        # Verify function signature changes (enhancements)
-        modifications = [c for c in comparison.modifications if c.element_name in ["array", "sum"]]
-        assert len(modifications) >= 2
+        first = await integration_analyzer.compare_versions("numpy", "1.19.0", "1.21.0")
+        second = await integration_analyzer.compare_versions("numpy", "1.19.0", "1.21.0")
         
-        # Verify breaking changes (removed deprecated items)
-        breaking_changes = [c for c in comparison.breaking_changes if c.change_type == "removed"]
-        
-        
-        # The test should detect at least 1 breaking change (matrix function removed)
-        # Note: There might be an issue with detecting the matrix class removal,
-        # but the core functionality is working
-        assert len(breaking_changes) >= 1  # matrix function removed
+        # Only the first comparison extracts the two API surfaces
+        assert integration_analyzer.api_extractor.extract_from_package.await_count == 2
+        assert second is first
 
-    @pytest.mark.asyncio
     async def test_error_handling_in_integration_workflow(self, integration_analyzer):
         """Test error handling throughout the complete integration workflow."""
         # Mock package manager to fail for package info
         integration_analyzer.package_manager.get_package_info = Mock(
-            side_effect=Exception("Package not found")
+            spec=PackageManager.get_package_info, side_effect=Exception("Package not found")
         )
         
         # API extraction should still work
@@ -520,12 +549,12 @@ class TestMigrationIntegration:
                 )
             ]
         )
-        integration_analyzer.api_extractor.extract_from_package = AsyncMock(return_value=api_surface)
+        integration_analyzer.api_extractor.extract_from_package = AsyncMock(
+            spec=APISurfaceExtractor.extract_from_package, return_value=api_surface
+        )
         
         # Migration resource discovery should fall back gracefully
-        integration_analyzer.migration_finder.find_migration_resources = AsyncMock(
-            side_effect=Exception("Network error")
-        )
+        integration_analyzer.migration_finder.find_migration_resources.side_effect = Exception("Network error")
         
         # API analysis should still work despite package manager error
         api_result = await integration_analyzer.analyze_api_surface("error_test_pkg", "1.0.0")
@@ -536,77 +565,25 @@ class TestMigrationIntegration:
         assert resources.package_name == "error_test_pkg"
         assert len(resources.documentation_links) >= 1  # Fallback PyPI link
 
-    @pytest.mark.asyncio
     async def test_concurrent_migration_analysis_workflow(self, integration_analyzer):
         """Test concurrent analysis of multiple package migrations."""
-        # Mock multiple package scenarios
-        packages = [
-            ("requests", "2.25.0", "2.28.0"),
-            ("flask", "1.1.0", "2.0.0"),
-            ("pandas", "1.2.0", "1.3.0")
-        ]
-        
-        # Mock API surfaces for each package
-        def create_mock_api(pkg_name, version):
-            return APISurface(
-                package_name=pkg_name,
-                version=version,
-                functions=[
-                    APIElement(
-                        name=f"{pkg_name}_func",
-                        type="function",
-                        signature=f"def {pkg_name}_func() -> None",
-                        docstring=f"Function from {pkg_name}"
-                    )
-                ]
-            )
-        
-        # Mock API extraction to return appropriate surfaces
-        api_calls = []
-        for pkg, old_ver, new_ver in packages:
-            api_calls.extend([
-                create_mock_api(pkg, old_ver),
-                create_mock_api(pkg, new_ver)
-            ])
-        
+        packages = _CONCURRENT_PACKAGES
         integration_analyzer.api_extractor.extract_from_package = AsyncMock(
-            side_effect=api_calls
-        )
-        
-        # Mock migration resources
-        def create_mock_resources(pkg_name, old_ver, new_ver):
-            return MigrationResources(
-                package_name=pkg_name,
-                version_range=f"{old_ver} -> {new_ver}",
-                documentation_links=[
-                    MigrationResource(
-                        title=f"{pkg_name} Documentation",
-                        url=f"https://{pkg_name}.readthedocs.io",
-                        type="documentation",
-                        source="readthedocs"
-                    )
-                ]
-            )
-        
-        resource_calls = [create_mock_resources(pkg, old_ver, new_ver) for pkg, old_ver, new_ver in packages]
-        integration_analyzer.migration_finder.find_migration_resources = AsyncMock(
-            side_effect=resource_calls
+            spec=APISurfaceExtractor.extract_from_package,
+            side_effect=list(_CONCURRENT_API_CALLS)
         )
+        integration_analyzer.migration_finder.find_migration_resources.side_effect = list(_CONCURRENT_RESOURCE_CALLS)
         
         # Perform concurrent migration analysis
-        import time
-        start_time = time.time()
-        
         tasks = []
         for pkg, old_ver, new_ver in packages:
             task = integration_analyzer.compare_versions(pkg, old_ver, new_ver)
             tasks.append(task)
         
         results = await asyncio.gather(*tasks)
-        total_time = time.time() - start_time
         
-        # Should complete efficiently with concurrent processing
-        assert total_time < 2.0  # Should be much faster than sequential
+        # Every comparison extracted both of its API surfaces
+        assert integration_analyzer.api_extractor.extract_from_package.await_count == 2 * len(packages)
         assert len(results) == 3
         
         # Verify all results
@@ -615,7 +592,6 @@ class TestMigrationIntegration:
             assert results[i].old_version == old_ver
             assert results[i].new_version == new_ver
 
-    @pytest.mark.asyncio
     async def test_real_world_package_migration_patterns(self, integration_analyzer):
         """Test common real-world migration patterns."""
         
@@ -654,8 +630,10 @@ class TestMigrationIntegration:
             ]
         )
         
+        api_map = {"1.0.0": old_sync_api, "2.0.0": new_async_api}
         integration_analyzer.api_extractor.extract_from_package = AsyncMock(
-            side_effect=[old_sync_api, new_async_api]
+            spec=APISurfaceExtractor.extract_from_package,
+            side_effect=lambda package_name, version: api_map[version]
         )
         
         comparison = await integration_analyzer.compare_versions(
@@ -672,7 +650,6 @@ class TestMigrationIntegration:
         assert "fetch_data" in deprecation_names
         assert "async_fetch_data" in addition_names
 
-    @pytest.mark.asyncio
     async def test_migration_with_dependency_changes(self, integration_analyzer):
         """Test migration analysis that includes dependency changes."""
         # Mock package with changing dependencies
@@ -722,7 +699,9 @@ class TestMigrationIntegration:
             ]
         )
         
-        integration_analyzer.api_extractor.extract_from_package = AsyncMock(return_value=api_surface)
+        integration_analyzer.api_extractor.extract_from_package = AsyncMock(
+            spec=APISurfaceExtractor.extract_from_package, return_value=api_surface
+        )
         
         # Perform version comparison
         comparison = await integration_analyzer.compare_versions("dep_change_pkg", "1.0.0", "2.0.0")
@@ -1,9 +1,15 @@
 """Performance tests for migration functionality."""
 
 import asyncio
+import contextlib
+import functools
+import gc
+import itertools
+import os
 import time
-import tempfile
+import tracemalloc
 from unittest.mock import Mock, AsyncMock
+import anyio
 import pytest
 
 from mcp_server.migration_analyzer import MigrationAnalyzer
@@ -11,23 +17,190 @@ from mcp_server.migration_models import APIElement, APISurface
 from mcp_server.package_manager import PackageManager
 
 
+# Scale the dataset sizes, e.g. PERF_SCALE=0.1 for a quick smoke run on slow CI runners
+PERF_SCALE = float(os.environ.get("PERF_SCALE", "1.0"))
+
+
+def _scaled(count):
+    return max(1, int(count * PERF_SCALE))
+
+
+N_LARGE_CLASSES = _scaled(500)
+N_LARGE_FUNCTIONS = _scaled(1000)
+N_LARGE_CONSTANTS = _scaled(200)
+N_CACHED_PACKAGES = _scaled(50)
+N_MEMORY_PACKAGES = _scaled(20)
+N_MEMORY_FUNCTIONS = _scaled(100)
+
+# Default value shown in every large-surface constant signature
+_CONST_DICT_REPR = "{" + ", ".join(f"'key_{j}': {j}" for j in range(5)) + "}"
+
+
+@functools.lru_cache(maxsize=None)
+def _func_element(i):
+    """Build the trivial ``func_{i}`` element once; mocked extractors share it across packages."""
+    return APIElement(
+        name=f"func_{i}",
+        type="function",
+        signature=f"def func_{i}() -> None",
+        docstring=f"Function {i}"
+    )
+
+
+class _Timing:
+    elapsed = 0.0
+
+
+@contextlib.contextmanager
+def _timed():
+    """Time the enclosed block with the garbage collector paused, as pyperformance does."""
+    timing = _Timing()
+    gc_was_enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    start = time.perf_counter()
+    try:
+        yield timing
+    finally:
+        timing.elapsed = time.perf_counter() - start
+        if gc_was_enabled:
+            gc.enable()
+
+
+async def _run_in_task_group(coros):
+    """Run coroutines in one task group and return their results in order."""
+    results = [None] * len(coros)
+    
+    async def run(index, coro):
+        results[index] = await coro
+    
+    async with anyio.create_task_group() as tg:
+        for index, coro in enumerate(coros):
+            tg.start_soon(run, index, coro)
+    return results
+
+
+@pytest.fixture(scope="session")
+def perf_cache_dir(tmp_path_factory):
+    """Disk cache directory shared by all performance tests in the session.
+    
+    Safe under pytest-xdist: each worker gets its own directory, named after the worker.
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    return tmp_path_factory.mktemp(f"perf_cache_{worker}")
+
+
+@pytest.fixture(scope="module")
+def large_api_surface():
+    """Build a very large API surface (simulating packages like NumPy, Django) once per module."""
+    return APISurface(
+        package_name="large_package",
+        version="1.0.0",
+        classes=[
+            APIElement(
+                name=f"Class{i}",
+                type="class",
+                signature=f"class Class{i}(BaseClass{i % 5})",
+                docstring=f"Class {i} with complex inheritance"
+            )
+            for i in range(N_LARGE_CLASSES)
+        ],
+        functions=[
+            APIElement(
+                name=f"function_{i}",
+                type="function",
+                signature=f"def function_{i}(arg1: str, arg2: int = {i}, *args, **kwargs) -> Union[str, int]",
+                docstring=f"Complex function {i} with multiple parameters"
+            )
+            for i in range(N_LARGE_FUNCTIONS)
+        ],
+        constants=[
+            APIElement(
+                name=f"CONSTANT_{i}",
+                type="constant",
+                signature=f"CONSTANT_{i}: Dict[str, Any] = {_CONST_DICT_REPR}",
+                docstring=f"Complex constant {i}"
+            )
+            for i in range(N_LARGE_CONSTANTS)
+        ]
+    )
+
+
+@pytest.fixture(scope="module")
+def old_api_surface_v1():
+    """Build the 1.0.0 side of the version comparison benchmark."""
+    return APISurface(
+        package_name="perf_package",
+        version="1.0.0",
+        functions=[
+            APIElement(
+                name=f"function_{i}",
+                type="function",
+                signature=f"def function_{i}(x: int) -> str",
+                docstring=f"Function {i}"
+            )
+            for i in range(500)
+        ]
+    )
+
+
+@pytest.fixture(scope="module")
+def new_api_surface_v2(old_api_surface_v1):
+    """Build the 2.0.0 side: 400 unchanged, 50 modified, 50 removed and 100 new functions."""
+    return APISurface(
+        package_name="perf_package",
+        version="2.0.0",
+        # Keep functions 0-399 the same (shared instances; the diff compares by value)
+        functions=old_api_surface_v1.functions[:400] + [
+            # Modify functions 400-449 (50 functions)
+            APIElement(
+                name=f"function_{i}",
+                type="function",
+                signature=f"def function_{i}(x: int, y: str = 'default') -> str",
+                docstring=f"Modified function {i}"
+            )
+            for i in range(400, 450)
+        ] + [
+            # Add 100 new functions
+            APIElement(
+                name=f"new_function_{i}",
+                type="function",
+                signature=f"def new_function_{i}(y: float) -> int",
+                docstring=f"New function {i}"
+            )
+            for i in range(100)
+        ]
+        # Functions 450-499 are removed (50 functions)
+    )
+
+
 class TestMigrationPerformance:
     """Performance tests for migration analysis operations."""
 
     @pytest.fixture
-    def performance_analyzer(self):
-        """Create a migration analyzer optimized for performance testing."""
+    async def performance_analyzer(self, perf_cache_dir):
+        """Create a migration analyzer optimized for performance testing.
+        
+        Each test gets fresh in-memory caches; the disk cache directory is shared
+        and package names are unique per test.
+        """
         package_manager = Mock(spec=PackageManager)
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            analyzer = MigrationAnalyzer(
+        # Eager tasks (Python 3.12+) let cache hits finish without a scheduler round-trip
+        loop = asyncio.get_running_loop()
+        task_factory = loop.get_task_factory()
+        if hasattr(asyncio, "eager_task_factory"):
+            loop.set_task_factory(asyncio.eager_task_factory)
+        
+        try:
+            yield MigrationAnalyzer(
                 package_manager=package_manager,
-                cache_dir=temp_dir,
+                cache_dir=str(perf_cache_dir),
                 timeout=30.0
             )
-            yield analyzer
+        finally:
+            loop.set_task_factory(task_factory)
 
-    @pytest.mark.asyncio
     async def test_concurrent_api_analysis_performance(self, performance_analyzer):
         """Test performance of concurrent API surface analysis."""
         # Mock API extraction with realistic timing
@@ -37,15 +210,7 @@ class TestMigrationPerformance:
             return APISurface(
                 package_name=package_name,
                 version=version,
-                functions=[
-                    APIElement(
-                        name=f"func_{i}",
-                        type="function",
-                        signature=f"def func_{i}() -> None",
-                        docstring=f"Function {i}"
-                    )
-                    for i in range(10)  # 10 functions per package
-                ]
+                functions=[_func_element(i) for i in range(10)]  # 10 functions per package
             )
         
         performance_analyzer.api_extractor.extract_from_package = mock_extract
@@ -53,15 +218,12 @@ class TestMigrationPerformance:
         # Test with 10 concurrent analyses
         packages = [(f"package_{i}", "1.0.0") for i in range(10)]
         
-        start_time = time.time()
-        
-        tasks = [
-            performance_analyzer.analyze_api_surface(pkg, ver)
-            for pkg, ver in packages
-        ]
-        results = await asyncio.gather(*tasks)
-        
-        total_time = time.time() - start_time
+        with _timed() as timing:
+            results = await _run_in_task_group([
+                performance_analyzer.analyze_api_surface(pkg, ver)
+                for pkg, ver in packages
+            ])
+        total_time = timing.elapsed
         
         # Should complete in roughly 0.05s (concurrent) not 0.5s (sequential)
         assert total_time < 0.15, f"Concurrent analysis took {total_time}s, expected < 0.15s"
@@ -72,245 +234,156 @@ class TestMigrationPerformance:
             assert result.package_name == f"package_{i}"
             assert len(result.functions) == 10
 
-    @pytest.mark.asyncio
-    async def test_large_api_surface_performance(self, performance_analyzer):
+    async def test_large_api_surface_performance(self, performance_analyzer, large_api_surface):
         """Test performance with large API surfaces."""
-        # Create a very large API surface (simulating packages like NumPy, Django)
-        large_api = APISurface(
-            package_name="large_package",
-            version="1.0.0",
-            classes=[
-                APIElement(
-                    name=f"Class{i}",
-                    type="class",
-                    signature=f"class Class{i}(BaseClass{i % 5})",
-                    docstring=f"Class {i} with complex inheritance"
-                )
-                for i in range(500)  # 500 classes
-            ],
-            functions=[
-                APIElement(
-                    name=f"function_{i}",
-                    type="function",
-                    signature=f"def function_{i}(arg1: str, arg2: int = {i}, *args, **kwargs) -> Union[str, int]",
-                    docstring=f"Complex function {i} with multiple parameters"
-                )
-                for i in range(1000)  # 1000 functions
-            ],
-            constants=[
-                APIElement(
-                    name=f"CONSTANT_{i}",
-                    type="constant",
-                    signature=f"CONSTANT_{i}: Dict[str, Any] = " + str({f'key_{j}': j for j in range(5)}),
-                    docstring=f"Complex constant {i}"
-                )
-                for i in range(200)  # 200 constants
-            ]
-        )
+        async def mock_extract(package_name, version):
+            return large_api_surface
         
-        performance_analyzer.api_extractor.extract_from_package = AsyncMock(return_value=large_api)
+        performance_analyzer.api_extractor.extract_from_package = mock_extract
         
         # Test analysis performance
-        start_time = time.time()
-        result = await performance_analyzer.analyze_api_surface("large_package", "1.0.0")
-        analysis_time = time.time() - start_time
+        with _timed() as timing:
+            result = await performance_analyzer.analyze_api_surface("large_package", "1.0.0")
+        analysis_time = timing.elapsed
         
-        # Should handle large API surface efficiently (< 2 seconds)
-        assert analysis_time < 2.0, f"Large API analysis took {analysis_time}s, expected < 2.0s"
-        assert len(result.classes) == 500
-        assert len(result.functions) == 1000
-        assert len(result.constants) == 200
+        # Should handle large API surface efficiently (< 0.5 seconds)
+        assert analysis_time < 0.5, f"Large API analysis took {analysis_time}s, expected < 0.5s"
+        assert len(result.classes) == N_LARGE_CLASSES
+        assert len(result.functions) == N_LARGE_FUNCTIONS
+        assert len(result.constants) == N_LARGE_CONSTANTS
         
         # Test caching performance
-        start_time = time.time()
-        cached_result = await performance_analyzer.analyze_api_surface("large_package", "1.0.0")
-        cache_time = time.time() - start_time
+        with _timed() as timing:
+            cached_result = await performance_analyzer.analyze_api_surface("large_package", "1.0.0")
+        cache_time = timing.elapsed
         
-        # Cached access should be very fast (< 0.1 seconds)
-        assert cache_time < 0.1, f"Cache access took {cache_time}s, expected < 0.1s"
-        assert cached_result == result
+        # Cached access should be very fast (< 0.01 seconds)
+        assert cache_time < 0.01, f"Cache access took {cache_time}s, expected < 0.01s"
+        assert cached_result is result
 
-    @pytest.mark.asyncio
-    async def test_version_comparison_performance(self, performance_analyzer):
+    @pytest.mark.benchmark(group="comparison")
+    def test_version_comparison_performance(
+        self, benchmark, performance_analyzer, old_api_surface_v1, new_api_surface_v2
+    ):
         """Test performance of version comparison with large API surfaces."""
-        # Create two large API surfaces with differences
-        old_api = APISurface(
-            package_name="perf_package",
-            version="1.0.0",
-            functions=[
-                APIElement(
-                    name=f"function_{i}",
-                    type="function",
-                    signature=f"def function_{i}(x: int) -> str",
-                    docstring=f"Function {i}"
-                )
-                for i in range(500)
-            ]
-        )
-        
-        new_api = APISurface(
-            package_name="perf_package", 
-            version="2.0.0",
-            functions=[
-                # Keep functions 0-399 the same
-                APIElement(
-                    name=f"function_{i}",
-                    type="function",
-                    signature=f"def function_{i}(x: int) -> str",
-                    docstring=f"Function {i}"
-                )
-                for i in range(400)
-            ] + [
-                # Modify functions 400-449 (50 functions)
-                APIElement(
-                    name=f"function_{i}",
-                    type="function",
-                    signature=f"def function_{i}(x: int, y: str = 'default') -> str",
-                    docstring=f"Modified function {i}"
-                )
-                for i in range(400, 450)
-            ] + [
-                # Add 100 new functions
-                APIElement(
-                    name=f"new_function_{i}",
-                    type="function",
-                    signature=f"def new_function_{i}(y: float) -> int",
-                    docstring=f"New function {i}"
-                )
-                for i in range(100)
-            ]
-            # Functions 450-499 are removed (50 functions)
-        )
-        
-        performance_analyzer.api_extractor.extract_from_package = AsyncMock(
-            side_effect=[old_api, new_api]
-        )
-        
-        start_time = time.time()
-        comparison = await performance_analyzer.compare_versions("perf_package", "1.0.0", "2.0.0")
-        comparison_time = time.time() - start_time
+        # Benchmark the comparison itself; compare_versions would serve repeat rounds from cache
+        with _timed() as timing:
+            comparison = benchmark(
+                performance_analyzer.version_comparator.compare_api_surfaces, old_api_surface_v1, new_api_surface_v2
+            )
         
-        # Should complete version comparison efficiently (< 3 seconds)
+        # Stats are only collected when benchmarking is enabled; under xdist (the default
+        # run) benchmark() makes a single plain call, so bound that call instead
+        comparison_time = benchmark.stats["median"] if benchmark.stats else timing.elapsed
         assert comparison_time < 3.0, f"Version comparison took {comparison_time}s, expected < 3.0s"
         
         # Verify comparison results
-        assert len(comparison.additions) == 100  # New functions
-        assert len(comparison.modifications) == 50  # Modified functions
+        assert {c.element_name for c in comparison.additions} == {f"new_function_{i}" for i in range(100)}
+        assert {c.element_name for c in comparison.modifications} == {f"function_{i}" for i in range(400, 450)}
         # Note: removals are detected as breaking changes
-        assert len(comparison.breaking_changes) >= 50  # Removed functions
+        removed = {c.element_name for c in comparison.breaking_changes if c.change_type == "removed"}
+        assert removed == {f"function_{i}" for i in range(450, 500)}
 
-    @pytest.mark.asyncio
     async def test_cache_performance_with_many_packages(self, performance_analyzer):
         """Test caching performance with many different packages."""
-        # Mock extraction for many packages
-        async def mock_extract(package_name, version):
-            await asyncio.sleep(0.01)  # Small delay to simulate work
-            return APISurface(
+        # Mock extraction for many packages; no artificial delay, this measures caching only
+        performance_analyzer.api_extractor.extract_from_package = AsyncMock(
+            side_effect=lambda package_name, version: APISurface(
                 package_name=package_name,
                 version=version,
-                functions=[
-                    APIElement(
-                        name=f"func_{i}",
-                        type="function",
-                        signature=f"def func_{i}() -> None",
-                        docstring=f"Function {i}"
-                    )
-                    for i in range(5)
-                ]
+                functions=[_func_element(i) for i in range(5)]
             )
-        
-        performance_analyzer.api_extractor.extract_from_package = mock_extract
+        )
         
         # Analyze many packages
-        packages = [(f"pkg_{i}", f"{i}.0.0") for i in range(50)]
+        packages = [(f"pkg_{i}", f"{i}.0.0") for i in range(N_CACHED_PACKAGES)]
         
         # First round - should extract all
-        start_time = time.time()
-        first_results = []
-        for pkg, ver in packages:
-            result = await performance_analyzer.analyze_api_surface(pkg, ver)
-            first_results.append(result)
-        first_round_time = time.time() - start_time
+        with _timed() as timing:
+            first_results = await _run_in_task_group([
+                performance_analyzer.analyze_api_surface(pkg, ver) for pkg, ver in packages
+            ])
+        first_round_time = timing.elapsed
         
         # Second round - should use cache
-        start_time = time.time()
-        second_results = []
-        for pkg, ver in packages:
-            result = await performance_analyzer.analyze_api_surface(pkg, ver)
-            second_results.append(result)
-        second_round_time = time.time() - start_time
-        
-        # Second round should be much faster (cache hits)
-        speedup_ratio = first_round_time / second_round_time
-        assert speedup_ratio > 5, f"Cache speedup was only {speedup_ratio}x, expected > 5x"
+        with _timed() as timing:
+            second_results = await _run_in_task_group([
+                performance_analyzer.analyze_api_surface(pkg, ver) for pkg, ver in packages
+            ])
+        second_round_time = timing.elapsed
+        
+        # Second round should be served entirely from the memory cache
+        assert performance_analyzer.api_extractor.extract_from_package.await_count == len(packages)
+        assert second_round_time < first_round_time, (
+            f"Cached round took {second_round_time}s, first round {first_round_time}s"
+        )
         
         # Results should be identical
         for first, second in zip(first_results, second_results):
-            assert first.package_name == second.package_name
-            assert first.version == second.version
+            assert second is first
 
-    @pytest.mark.asyncio
     async def test_memory_usage_with_large_datasets(self, performance_analyzer):
         """Test memory efficiency with large datasets."""
-        import psutil
-        import os
-        
-        process = psutil.Process(os.getpid())
-        initial_memory = process.memory_info().rss / 1024 / 1024  # MB
-        
-        # Create and analyze many large API surfaces
-        large_apis = []
-        for i in range(20):  # 20 large packages
-            api = APISurface(
-                package_name=f"large_pkg_{i}",
-                version="1.0.0",
-                functions=[
-                    APIElement(
-                        name=f"func_{j}",
-                        type="function",
-                        signature=f"def func_{j}(arg1: str, arg2: int = {j}) -> str",
-                        docstring=f"Function {j} in package {i}"
-                    )
-                    for j in range(100)  # 100 functions per package
-                ]
-            )
-            large_apis.append(api)
-        
-        # Mock extraction to return these large APIs
-        api_iter = iter(large_apis)
-        performance_analyzer.api_extractor.extract_from_package = AsyncMock(
-            side_effect=lambda pkg, ver: next(api_iter)
-        )
-        
-        # Analyze all packages
-        results = []
-        for i in range(20):
-            result = await performance_analyzer.analyze_api_surface(f"large_pkg_{i}", "1.0.0")
-            results.append(result)
+        # Only count Python allocations made by this test, not interpreter or allocator noise
+        tracemalloc.start()
+        try:
+            initial_snapshot = tracemalloc.take_snapshot()
+            
+            # Create and analyze many large API surfaces
+            large_apis = []
+            for i in range(N_MEMORY_PACKAGES):
+                api = APISurface(
+                    package_name=f"large_pkg_{i}",
+                    version="1.0.0",
+                    functions=[
+                        APIElement(
+                            name=f"func_{j}",
+                            type="function",
+                            signature=f"def func_{j}(arg1: str, arg2: int = {j}) -> str",
+                            docstring=f"Function {j} in package {i}"
+                        )
+                        for j in range(N_MEMORY_FUNCTIONS)
+                    ]
+                )
+                large_apis.append(api)
+            
+            # Mock extraction to return these large APIs, keyed so scheduling order doesn't matter
+            apis_by_key = {(api.package_name, api.version): api for api in large_apis}
+            
+            async def mock_extract(package_name, version):
+                return apis_by_key[(package_name, version)]
+            
+            performance_analyzer.api_extractor.extract_from_package = mock_extract
+            
+            # Analyze all packages
+            results = await _run_in_task_group([
+                performance_analyzer.analyze_api_surface(f"large_pkg_{i}", "1.0.0") for i in range(N_MEMORY_PACKAGES)
+            ])
+            
+            final_snapshot = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
         
-        final_memory = process.memory_info().rss / 1024 / 1024  # MB
-        memory_increase = final_memory - initial_memory
+        stats = final_snapshot.compare_to(initial_snapshot, 'filename')
+        memory_increase = sum(stat.size_diff for stat in stats) / 1024 / 1024  # MB
         
-        # Memory increase should be reasonable (< 100MB for this test)
-        assert memory_increase < 100, f"Memory increased by {memory_increase}MB, expected < 100MB"
+        # Memory increase should be reasonable (< 50MB for this test)
+        assert memory_increase < 50, f"Memory increased by {memory_increase}MB, expected < 50MB"
         
         # Verify all results are present
-        assert len(results) == 20
+        assert len(results) == N_MEMORY_PACKAGES
         for i, result in enumerate(results):
             assert result.package_name == f"large_pkg_{i}"
-            assert len(result.functions) == 100
+            assert len(result.functions) == N_MEMORY_FUNCTIONS
 
-    @pytest.mark.asyncio
     async def test_timeout_handling_performance(self, performance_analyzer):
         """Test that timeout handling doesn't significantly impact performance."""
         # Mock extraction with variable timing
-        call_count = 0
+        call_counter = itertools.count(1)
+        
         async def mock_extract_variable_timing(package_name, version):
-            nonlocal call_count
-            call_count += 1
-            
             # Some calls are fast, some are slow
-            if call_count % 3 == 0:
+            if next(call_counter) % 3 == 0:
                 await asyncio.sleep(0.2)  # Slow call
             else:
                 await asyncio.sleep(0.01)  # Fast call
@@ -320,18 +393,15 @@ class TestMigrationPerformance:
         performance_analyzer.api_extractor.extract_from_package = mock_extract_variable_timing
         
         # Analyze multiple packages with mixed timing
-        packages = [(f"pkg_{i}", "1.0.0") for i in range(9)]  # 9 packages (3 slow, 6 fast)
+        packages = [(f"timed_pkg_{i}", "1.0.0") for i in range(9)]  # 9 packages (3 slow, 6 fast)
         
-        start_time = time.time()
-        
-        # Run concurrently
-        tasks = [
-            performance_analyzer.analyze_api_surface(pkg, ver)
-            for pkg, ver in packages
-        ]
-        results = await asyncio.gather(*tasks)
-        
-        total_time = time.time() - start_time
+        with _timed() as timing:
+            # Run concurrently
+            results = await _run_in_task_group([
+                performance_analyzer.analyze_api_surface(pkg, ver)
+                for pkg, ver in packages
+            ])
+        total_time = timing.elapsed
         
         # Should complete in roughly 0.2s (limited by slowest concurrent call)
         # not 0.6s (3 * 0.2s if sequential)
@@ -340,10 +410,10 @@ class TestMigrationPerformance:
         
         # All results should be valid
         for i, result in enumerate(results):
-            assert result.package_name == f"pkg_{i}"
+            assert result.package_name == f"timed_pkg_{i}"
 
-    @pytest.mark.asyncio
-    async def test_disk_cache_performance(self, performance_analyzer):
+    @pytest.mark.benchmark(group="cache")
+    def test_disk_cache_performance(self, benchmark, performance_analyzer):
         """Test disk cache read/write performance."""
         # Create a moderately large API surface
         api_surface = APISurface(
@@ -372,26 +442,24 @@ class TestMigrationPerformance:
         performance_analyzer.api_extractor.extract_from_package = AsyncMock(return_value=api_surface)
         
         # First call - extract and cache
-        start_time = time.time()
-        result1 = await performance_analyzer.analyze_api_surface("cache_test_pkg", "1.0.0")
-        first_call_time = time.time() - start_time
+        result1 = asyncio.run(performance_analyzer.analyze_api_surface("cache_test_pkg", "1.0.0"))
+        
+        async def load_from_disk():
+            # Clear memory cache to force disk cache usage
+            performance_analyzer._api_cache.clear()
+            return await performance_analyzer.analyze_api_surface("cache_test_pkg", "1.0.0")
         
-        # Clear memory cache to force disk cache usage
-        performance_analyzer._api_cache.clear()
+        with _timed() as timing:
+            result2 = benchmark(lambda: asyncio.run(load_from_disk()))
         
-        # Second call - should load from disk cache
-        start_time = time.time()
-        result2 = await performance_analyzer.analyze_api_surface("cache_test_pkg", "1.0.0")
-        disk_cache_time = time.time() - start_time
+        # Same fallback as the comparison benchmark when stats are not collected
+        load_time = benchmark.stats["median"] if benchmark.stats else timing.elapsed
+        assert load_time < 0.5, f"Disk cache load took {load_time}s, expected < 0.5s"
         
-        # In test environments, disk cache performance can vary significantly
-        # The important thing is that both calls return the same results
-        # Performance optimization is less critical in tests
-        speedup = first_call_time / disk_cache_time if disk_cache_time > 0 else float('inf')
-        # Very lenient assertion - just ensure it doesn't fail catastrophically
-        assert speedup > 0.01, f"Disk cache speedup was only {speedup}x, expected > 0.01x"
+        # Every round was served from disk, never re-extracted
+        performance_analyzer.api_extractor.extract_from_package.assert_awaited_once()
         
         # Results should be identical
         assert result1.package_name == result2.package_name
         assert len(result1.functions) == len(result2.functions)
-        assert len(result1.classes) == len(result2.classes)
\ No newline at end of file
+        assert len(result1.classes) == len(result2.classes)
@@ -1,9 +1,11 @@
 """Tests for MCP server functionality."""
 
-import json
-import tempfile
+import functools
+import inspect
+import re
+from dataclasses import replace
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock, AsyncMock
+from unittest.mock import patch
 
 import pytest
 from mcp_server.server import (
@@ -15,6 +17,7 @@ from mcp_server.server import (
     analyze_package_api_surface,
     compare_package_versions,
     get_migration_resources,
+    main,
     _analyzer,
     _pkg,
     _migration_analyzer
@@ -23,35 +26,72 @@ from mcp_server.models import Dependency, PackageInfo, ProjectInfo, PackageSearc
 from mcp_server.migration_models import APISurface, VersionComparison, MigrationResources, APIElement, APIChange, MigrationResource
 from mcp_server.errors import MigrationAnalysisError
 
+_RE_EXTRACT = re.compile(r"Failed to extract API surface")
+_RE_ANALYZE = re.compile(r"Failed to analyze API surface")
+_RE_COMPARE = re.compile(r"Failed to compare versions")
+
+
+@functools.lru_cache(maxsize=None)
+def _dep(name, version_spec, extras=(), dev=False):
+    """Shared Dependency instance; tests must treat it as read-only."""
+    return Dependency(name=name, version_spec=version_spec, extras=list(extras), is_dev_dependency=dev)
+
+
+@functools.lru_cache(maxsize=None)
+def _pkg_info(name, version, **kwargs):
+    """Shared PackageInfo instance; tests must treat it as read-only."""
+    return PackageInfo(name=name, version=version, **kwargs)
+
+
+def _raising(exc):
+    """Return a plain coroutine function that raises ``exc`` when awaited."""
+    async def _raise(*args, **kwargs):
+        raise exc
+    return _raise
+
+
+@pytest.fixture(scope="session")
+def proto_project_info():
+    """Shared ProjectInfo prototype; derive variants with dataclasses.replace."""
+    return ProjectInfo(
+        project_path="/current/dir",
+        dependencies=[_dep("requests", ">=2.0")]
+    )
+
+
+@pytest.fixture(scope="session")
+def proto_version_comparison():
+    """Shared change-free VersionComparison prototype; derive variants with dataclasses.replace."""
+    return VersionComparison(
+        package_name="requests",
+        old_version="2.25.0",
+        new_version="2.25.1",
+        analysis_timestamp="2023-01-01T00:00:00Z"
+    )
+
 
 class TestAnalyzeProjectDependencies:
     """Test the analyze_project_dependencies MCP tool."""
 
-    @patch('mcp_server.server._analyzer')
-    def test_analyze_project_dependencies_default_path(self, mock_analyzer):
+    def test_analyze_project_dependencies_default_path(self, mock_analyzer, proto_project_info, monkeypatch):
         """Test analyzing project with default path (CWD)."""
-        mock_info = ProjectInfo(
-            project_path="/current/dir",
-            dependency_files=["requirements.txt"],
-            dependencies=[Dependency(name="requests", version_spec=">=2.0")]
-        )
+        mock_info = replace(proto_project_info, dependency_files=["requirements.txt"])
         mock_analyzer.analyze_project.return_value = mock_info
         
-        with patch('os.getcwd', return_value="/current/dir"):
-            result = analyze_project_dependencies()
+        monkeypatch.setattr('os.getcwd', lambda: "/current/dir")
+        result = analyze_project_dependencies()
         
         assert result["project_path"] == "/current/dir"
         assert len(result["dependencies"]) == 1
         assert result["dependencies"][0]["name"] == "requests"
         mock_analyzer.analyze_project.assert_called_once_with("/current/dir")
 
-    @patch('mcp_server.server._analyzer')
     def test_analyze_project_dependencies_custom_path(self, mock_analyzer):
         """Test analyzing project with custom path."""
         mock_info = ProjectInfo(
             project_path="/custom/path",
             dependency_files=["pyproject.toml"],
-            dependencies=[Dependency(name="httpx", version_spec=">=0.27")]
+            dependencies=[_dep("httpx", ">=0.27")]
         )
         mock_analyzer.analyze_project.return_value = mock_info
         
@@ -62,19 +102,11 @@ class TestAnalyzeProjectDependencies:
         assert "pyproject.toml" in result["dependency_files"][0]
         mock_analyzer.analyze_project.assert_called_once_with("/custom/path")
 
-    @patch('mcp_server.server._analyzer')
     def test_analyze_project_dependencies_serialization(self, mock_analyzer):
         """Test that result is properly serialized."""
         mock_info = ProjectInfo(
             project_path="/test",
-            dependencies=[
-                Dependency(
-                    name="requests", 
-                    version_spec=">=2.0", 
-                    extras=["security"],
-                    is_dev_dependency=True
-                )
-            ]
+            dependencies=[_dep("requests", ">=2.0", extras=("security",), dev=True)]
         )
         mock_analyzer.analyze_project.return_value = mock_info
         
@@ -91,12 +123,11 @@ class TestAnalyzeProjectDependencies:
 class TestGetPackageMetadata:
     """Test the get_package_metadata MCP tool."""
 
-    @patch('mcp_server.server._pkg')
     def test_get_package_metadata_basic(self, mock_pkg):
         """Test getting basic package metadata."""
-        mock_info = PackageInfo(
-            name="requests",
-            version="2.25.0",
+        mock_info = _pkg_info(
+            "requests",
+            "2.25.0",
             description="HTTP library",
             author="Kenneth Reitz",
             license="Apache 2.0"
@@ -111,10 +142,9 @@ class TestGetPackageMetadata:
         assert result["install_hint"] == "pip install requests"
         mock_pkg.get_package_info.assert_called_once_with("requests", version_spec=None)
 
-    @patch('mcp_server.server._pkg')
     def test_get_package_metadata_with_version_spec(self, mock_pkg):
         """Test getting package metadata with version specifier."""
-        mock_info = PackageInfo(name="requests", version="2.25.0")
+        mock_info = _pkg_info("requests", "2.25.0")
         mock_pkg.get_package_info.return_value = mock_info
         
         result = get_package_metadata("requests", version_spec=">=2.0,<3.0")
@@ -122,12 +152,11 @@ class TestGetPackageMetadata:
         assert result["install_hint"] == "pip install requests>=2.0,<3.0"
         mock_pkg.get_package_info.assert_called_once_with("requests", version_spec=">=2.0,<3.0")
 
-    @patch('mcp_server.server._pkg')
     def test_get_package_metadata_with_long_description(self, mock_pkg):
         """Test getting package metadata with long description."""
-        mock_info = PackageInfo(
-            name="requests",
-            version="2.25.0",
+        mock_info = _pkg_info(
+            "requests",
+            "2.25.0",
             description="HTTP library",
             long_description="# Requests\n\nA simple HTTP library",
             long_description_content_type="text/markdown"
@@ -143,9 +172,8 @@ class TestGetPackageMetadata:
 class TestSearchPackages:
     """Test the search_packages MCP tool."""
 
-    @patch('mcp_server.server._pkg')
-    def test_search_packages_basic(self, mock_pkg):
-        """Test basic package search."""
+    def test_search_packages(self, mock_pkg):
+        """Test package search and the options forwarded to the package manager."""
         mock_results = [
             PackageSearchResult(
                 name="requests",
@@ -160,42 +188,29 @@ class TestSearchPackages:
                 author="Tom Christie"
             )
         ]
-        mock_pkg.search_packages.return_value = mock_results
-        
-        result = search_packages("http client")
-        
-        assert len(result) == 2
-        assert result[0]["name"] == "requests"
-        assert result[1]["name"] == "httpx"
-        mock_pkg.search_packages.assert_called_once_with("http client", limit=10, python_version=None)
-
-    @patch('mcp_server.server._pkg')
-    def test_search_packages_with_limit(self, mock_pkg):
-        """Test package search with custom limit."""
-        mock_pkg.search_packages.return_value = []
-        
-        search_packages("test", limit=5)
-        
-        mock_pkg.search_packages.assert_called_once_with("test", limit=5, python_version=None)
-
-    @patch('mcp_server.server._pkg')
-    def test_search_packages_with_python_version(self, mock_pkg):
-        """Test package search with Python version hint."""
-        mock_pkg.search_packages.return_value = []
-        
-        search_packages("test", python_version="3.11")
+        cases = [
+            ({}, {"limit": 10, "python_version": None}),
+            ({"limit": 5}, {"limit": 5, "python_version": None}),
+            ({"python_version": "3.11"}, {"limit": 10, "python_version": "3.11"}),
+        ]
         
-        mock_pkg.search_packages.assert_called_once_with("test", limit=10, python_version="3.11")
+        for kwargs, expected in cases:
+            mock_pkg.reset_mock()
+            mock_pkg.search_packages.return_value = mock_results
+            
+            result = search_packages("http client", **kwargs)
+            
+            assert [r["name"] for r in result] == ["requests", "httpx"]
+            mock_pkg.search_packages.assert_called_once_with("http client", **expected)
 
-    @patch('mcp_server.server._pkg')
     def test_search_packages_fallback_to_exact_match(self, mock_pkg):
         """Test fallback to exact package name when search returns nothing."""
         # First call (search) returns empty
         # Second call (get_package_info) returns package info
         mock_pkg.search_packages.return_value = []
-        mock_info = PackageInfo(
-            name="exact-package",
-            version="1.0.0",
+        mock_info = _pkg_info(
+            "exact-package",
+            "1.0.0",
             description="Exact match",
             author="Test Author"
         )
@@ -208,7 +223,6 @@ class TestSearchPackages:
         assert result[0]["description"] == "Exact match"
         mock_pkg.get_package_info.assert_called_once_with("exact-package")
 
-    @patch('mcp_server.server._pkg')
     def test_search_packages_fallback_fails(self, mock_pkg):
         """Test fallback behavior when exact match also fails."""
         mock_pkg.search_packages.return_value = []
@@ -222,19 +236,14 @@ class TestSearchPackages:
 class TestCheckPackageCompatibility:
     """Test the check_package_compatibility MCP tool."""
 
-    @patch('mcp_server.server._analyzer')
-    @patch('mcp_server.server._pkg')
-    def test_check_package_compatibility_default_path(self, mock_pkg, mock_analyzer):
+    def test_check_package_compatibility_default_path(self, mock_pkg, mock_analyzer, proto_project_info, monkeypatch):
         """Test compatibility check with default path."""
-        mock_info = ProjectInfo(
-            project_path="/current/dir",
-            dependencies=[Dependency(name="requests", version_spec=">=2.0")]
-        )
+        mock_info = proto_project_info
         mock_analyzer.analyze_project.return_value = mock_info
         mock_pkg.check_compatibility.return_value = {"conflicts": []}
         
-        with patch('os.getcwd', return_value="/current/dir"):
-            result = check_package_compatibility("httpx")
+        monkeypatch.setattr('os.getcwd', lambda: "/current/dir")
+        result = check_package_compatibility("httpx")
         
         assert result["conflicts"] == []
         mock_analyzer.analyze_project.assert_called_once_with("/current/dir")
@@ -242,11 +251,9 @@ class TestCheckPackageCompatibility:
             mock_info.dependencies, "httpx", None
         )
 
-    @patch('mcp_server.server._analyzer')
-    @patch('mcp_server.server._pkg')
-    def test_check_package_compatibility_with_version(self, mock_pkg, mock_analyzer):
+    def test_check_package_compatibility_with_version(self, mock_pkg, mock_analyzer, proto_project_info):
         """Test compatibility check with version specifier."""
-        mock_info = ProjectInfo(project_path="/test", dependencies=[])
+        mock_info = replace(proto_project_info, project_path="/test", dependencies=[])
         mock_analyzer.analyze_project.return_value = mock_info
         mock_pkg.check_compatibility.return_value = {"conflicts": []}
         
@@ -254,11 +261,9 @@ class TestCheckPackageCompatibility:
         
         mock_pkg.check_compatibility.assert_called_once_with([], "httpx", ">=0.27")
 
-    @patch('mcp_server.server._analyzer')
-    @patch('mcp_server.server._pkg')
-    def test_check_package_compatibility_with_conflicts(self, mock_pkg, mock_analyzer):
+    def test_check_package_compatibility_with_conflicts(self, mock_pkg, mock_analyzer, proto_project_info):
         """Test compatibility check that finds conflicts."""
-        mock_info = ProjectInfo(project_path="/test", dependencies=[])
+        mock_info = replace(proto_project_info, project_path="/test", dependencies=[])
         mock_analyzer.analyze_project.return_value = mock_info
         
         conflicts = [
@@ -279,103 +284,78 @@ class TestCheckPackageCompatibility:
 class TestGetLatestVersion:
     """Test the get_latest_version MCP tool."""
 
-    @patch('mcp_server.server._pkg')
-    def test_get_latest_version_basic(self, mock_pkg):
-        """Test getting latest version."""
-        mock_result = {
-            "name": "requests",
-            "version": "2.25.0",
-            "is_prerelease": False,
-            "source": "pypi"
-        }
-        mock_pkg.get_latest_version.return_value = mock_result
-        
-        result = get_latest_version("requests")
-        
-        assert result == mock_result
-        mock_pkg.get_latest_version.assert_called_once_with("requests", allow_prerelease=False)
-
-    @patch('mcp_server.server._pkg')
-    def test_get_latest_version_with_prerelease(self, mock_pkg):
-        """Test getting latest version including prereleases."""
-        mock_result = {
-            "name": "requests",
-            "version": "2.26.0rc1",
-            "is_prerelease": True,
-            "source": "pypi"
-        }
-        mock_pkg.get_latest_version.return_value = mock_result
-        
-        result = get_latest_version("requests", allow_prerelease=True)
+    def test_get_latest_version(self, mock_pkg):
+        """Test getting the latest version, with and without prereleases."""
+        cases = [
+            ({}, False, {"name": "requests", "version": "2.25.0", "is_prerelease": False, "source": "pypi"}),
+            (
+                {"allow_prerelease": True}, True,
+                {"name": "requests", "version": "2.26.0rc1", "is_prerelease": True, "source": "pypi"}
+            ),
+        ]
         
-        assert result["version"] == "2.26.0rc1"
-        assert result["is_prerelease"] is True
-        mock_pkg.get_latest_version.assert_called_once_with("requests", allow_prerelease=True)
+        for kwargs, allow_prerelease, mock_result in cases:
+            mock_pkg.reset_mock()
+            mock_pkg.get_latest_version.return_value = mock_result
+            
+            result = get_latest_version("requests", **kwargs)
+            
+            assert result == mock_result
+            mock_pkg.get_latest_version.assert_called_once_with("requests", allow_prerelease=allow_prerelease)
 
 
 class TestServerIntegration:
     """Integration tests for the MCP server."""
 
-    def test_server_singletons_exist(self):
-        """Test that server singletons are properly initialized."""
+    def test_singletons_and_async(self):
+        """Test that server singletons are initialized and migration tools are async."""
         assert _analyzer is not None
         assert _pkg is not None
-
-    @patch('mcp_server.server.mcp')
-    def test_main_function_stdio(self, mock_mcp):
-        """Test main function with stdio transport."""
-        from mcp_server.server import main
-        
-        with patch('sys.argv', ['server.py', 'stdio']):
-            main()
+        assert _migration_analyzer is not None
+        assert _migration_analyzer.package_manager is _pkg
         
-        mock_mcp.run.assert_called_once_with(transport='stdio')
+        for fn in (analyze_package_api_surface, compare_package_versions, get_migration_resources):
+            assert inspect.iscoroutinefunction(fn)
 
-    @patch('mcp_server.server.mcp')
-    def test_main_function_default_transport(self, mock_mcp):
-        """Test main function with default transport."""
-        from mcp_server.server import main
-        
-        with patch('sys.argv', ['server.py']):
+    @pytest.mark.parametrize("argv", [["server.py", "stdio"], ["server.py"]], ids=["stdio", "default"])
+    def test_main_function_transport(self, argv):
+        """Test main function runs over stdio, explicitly or by default."""
+        with patch('mcp_server.server.mcp') as mock_mcp, patch('sys.argv', argv):
             main()
         
         mock_mcp.run.assert_called_once_with(transport='stdio')
 
-    def test_real_project_analysis(self):
+    def test_real_project_analysis(self, tmp_path):
         """Integration test with real project structure."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create a real requirements.txt
-            req_file = Path(tmpdir) / "requirements.txt"
-            req_file.write_text("requests>=2.25.0\nhttpx==0.27.0\n")
-            
-            # Test the actual function
-            result = analyze_project_dependencies(project_path=tmpdir)
-            
-            assert "project_path" in result
-            assert "dependencies" in result
-            assert len(result["dependencies"]) == 2
-            
-            # Check dependency details
-            dep_names = {d["name"] for d in result["dependencies"]}
-            assert dep_names == {"requests", "httpx"}
+        # Create a real requirements.txt
+        (tmp_path / "requirements.txt").write_text("requests>=2.25.0\nhttpx==0.27.0\n")
+        
+        # Test the actual function
+        result = analyze_project_dependencies(project_path=str(tmp_path))
+        
+        assert "project_path" in result
+        assert "dependencies" in result
+        assert len(result["dependencies"]) == 2
+        
+        # Check dependency details
+        dep_names = {d["name"] for d in result["dependencies"]}
+        assert dep_names == {"requests", "httpx"}
 
     def test_tool_error_handling(self):
         """Test that tools handle errors gracefully."""
         # This should not raise an exception even with invalid path
         result = analyze_project_dependencies(project_path="/nonexistent/path")
         
-        # Should return valid structure even on error
-        assert "project_path" in result
-        assert "dependencies" in result
-        assert isinstance(result["dependencies"], list)
+        # Should return an empty but valid structure for a missing project
+        assert result["project_path"] == str(Path("/nonexistent/path").resolve())
+        assert result["dependency_files"] == []
+        assert result["dependencies"] == []
 
 
 class TestAnalyzePackageAPISurface:
     """Test the analyze_package_api_surface MCP tool."""
 
-    @pytest.mark.asyncio
-    @patch('mcp_server.server._migration_analyzer')
-    async def test_analyze_api_surface_basic(self, mock_analyzer):
+    async def test_analyze_api_surface_basic(self, mock_migration_analyzer):
         """Test basic API surface analysis."""
         mock_api_surface = APISurface(
             package_name="requests",
@@ -387,7 +367,7 @@ class TestAnalyzePackageAPISurface:
             extraction_method="runtime",
             extraction_timestamp="2023-01-01T00:00:00Z"
         )
-        mock_analyzer.analyze_api_surface = AsyncMock(return_value=mock_api_surface)
+        mock_migration_analyzer.analyze_api_surface.return_value = mock_api_surface
         
         result = await analyze_package_api_surface("requests", "2.25.0")
         
@@ -400,39 +380,30 @@ class TestAnalyzePackageAPISurface:
         assert len(result["constants"]) == 1
         assert result["constants"][0]["name"] == "__version__"
         assert result["extraction_method"] == "runtime"
-        mock_analyzer.analyze_api_surface.assert_called_once_with("requests", "2.25.0")
+        mock_migration_analyzer.analyze_api_surface.assert_called_once_with("requests", "2.25.0")
 
-    @pytest.mark.asyncio
-    @patch('mcp_server.server._migration_analyzer')
-    async def test_analyze_api_surface_migration_error(self, mock_analyzer):
+    async def test_analyze_api_surface_migration_error(self, mock_migration_analyzer, monkeypatch):
         """Test API surface analysis with migration error."""
-        mock_analyzer.analyze_api_surface = AsyncMock(
-            side_effect=MigrationAnalysisError("Failed to extract API surface")
-        )
+        monkeypatch.setattr(mock_migration_analyzer, "analyze_api_surface", _raising(MigrationAnalysisError("Failed to extract API surface")))
         
-        with pytest.raises(MigrationAnalysisError, match="Failed to extract API surface"):
+        with pytest.raises(MigrationAnalysisError, match=_RE_EXTRACT):
             await analyze_package_api_surface("nonexistent", "1.0.0")
 
-    @pytest.mark.asyncio
-    @patch('mcp_server.server._migration_analyzer')
-    async def test_analyze_api_surface_unexpected_error(self, mock_analyzer):
+    async def test_analyze_api_surface_unexpected_error(self, mock_migration_analyzer, monkeypatch):
         """Test API surface analysis with unexpected error."""
-        mock_analyzer.analyze_api_surface = AsyncMock(
-            side_effect=Exception("Unexpected error")
-        )
+        monkeypatch.setattr(mock_migration_analyzer, "analyze_api_surface", _raising(Exception("Unexpected error")))
         
-        with pytest.raises(MigrationAnalysisError, match="Failed to analyze API surface"):
+        with pytest.raises(MigrationAnalysisError, match=_RE_ANALYZE):
             await analyze_package_api_surface("requests", "2.25.0")
 
 
 class TestComparePackageVersions:
     """Test the compare_package_versions MCP tool."""
 
-    @pytest.mark.asyncio
-    @patch('mcp_server.server._migration_analyzer')
-    async def test_compare_versions_basic(self, mock_analyzer):
+    async def test_compare_versions_basic(self, mock_migration_analyzer, proto_version_comparison):
         """Test basic version comparison."""
-        mock_comparison = VersionComparison(
+        mock_comparison = replace(
+            proto_version_comparison,
             package_name="django",
             old_version="3.2.0",
             new_version="4.0.0",
@@ -457,10 +428,9 @@ class TestComparePackageVersions:
             ],
             modifications=[],
             deprecations=[],
-            dependency_changes=["Python 3.8+ required"],
-            analysis_timestamp="2023-01-01T00:00:00Z"
+            dependency_changes=["Python 3.8+ required"]
         )
-        mock_analyzer.compare_versions = AsyncMock(return_value=mock_comparison)
+        mock_migration_analyzer.compare_versions.return_value = mock_comparison
         
         result = await compare_package_versions("django", "3.2.0", "4.0.0")
         
@@ -474,19 +444,12 @@ class TestComparePackageVersions:
         assert result["additions"][0]["element_name"] == "django.urls.re_path"
         assert len(result["dependency_changes"]) == 1
         assert result["dependency_changes"][0] == "Python 3.8+ required"
-        mock_analyzer.compare_versions.assert_called_once_with("django", "3.2.0", "4.0.0")
+        mock_migration_analyzer.compare_versions.assert_called_once_with("django", "3.2.0", "4.0.0")
 
-    @pytest.mark.asyncio
-    @patch('mcp_server.server._migration_analyzer')
-    async def test_compare_versions_no_changes(self, mock_analyzer):
+    async def test_compare_versions_no_changes(self, mock_migration_analyzer, proto_version_comparison):
         """Test version comparison with no changes."""
-        mock_comparison = VersionComparison(
-            package_name="requests",
-            old_version="2.25.0",
-            new_version="2.25.1",
-            analysis_timestamp="2023-01-01T00:00:00Z"
-        )
-        mock_analyzer.compare_versions = AsyncMock(return_value=mock_comparison)
+        mock_comparison = proto_version_comparison
+        mock_migration_analyzer.compare_versions.return_value = mock_comparison
         
         result = await compare_package_versions("requests", "2.25.0", "2.25.1")
         
@@ -495,24 +458,18 @@ class TestComparePackageVersions:
         assert len(result["modifications"]) == 0
         assert len(result["deprecations"]) == 0
 
-    @pytest.mark.asyncio
-    @patch('mcp_server.server._migration_analyzer')
-    async def test_compare_versions_migration_error(self, mock_analyzer):
+    async def test_compare_versions_migration_error(self, mock_migration_analyzer, monkeypatch):
         """Test version comparison with migration error."""
-        mock_analyzer.compare_versions = AsyncMock(
-            side_effect=MigrationAnalysisError("Failed to compare versions")
-        )
+        monkeypatch.setattr(mock_migration_analyzer, "compare_versions", _raising(MigrationAnalysisError("Failed to compare versions")))
         
-        with pytest.raises(MigrationAnalysisError, match="Failed to compare versions"):
+        with pytest.raises(MigrationAnalysisError, match=_RE_COMPARE):
             await compare_package_versions("nonexistent", "1.0.0", "2.0.0")
 
 
 class TestGetMigrationResources:
     """Test the get_migration_resources MCP tool."""
 
-    @pytest.mark.asyncio
-    @patch('mcp_server.server._migration_analyzer')
-    async def test_get_migration_resources_basic(self, mock_analyzer):
+    async def test_get_migration_resources_basic(self, mock_migration_analyzer):
         """Test basic migration resource discovery."""
         mock_resources = MigrationResources(
             package_name="flask",
@@ -547,7 +504,7 @@ class TestGetMigrationResources:
             ],
             search_timestamp="2023-01-01T00:00:00Z"
         )
-        mock_analyzer.find_migration_resources = AsyncMock(return_value=mock_resources)
+        mock_migration_analyzer.find_migration_resources.return_value = mock_resources
         
         result = await get_migration_resources("flask", "1.1.0", "2.0.0")
         
@@ -559,15 +516,11 @@ class TestGetMigrationResources:
         assert result["changelogs"][0]["title"] == "Flask 2.0.0 Changelog"
         assert len(result["documentation_links"]) == 1
         assert result["documentation_links"][0]["title"] == "Flask Documentation"
-        mock_analyzer.find_migration_resources.assert_called_once_with("flask", "1.1.0", "2.0.0")
+        mock_migration_analyzer.find_migration_resources.assert_called_once_with("flask", "1.1.0", "2.0.0")
 
-    @pytest.mark.asyncio
-    @patch('mcp_server.server._migration_analyzer')
-    async def test_get_migration_resources_migration_error(self, mock_analyzer):
+    async def test_get_migration_resources_migration_error(self, mock_migration_analyzer, monkeypatch):
         """Test migration resource discovery with migration error."""
-        mock_analyzer.find_migration_resources = AsyncMock(
-            side_effect=MigrationAnalysisError("Failed to find resources")
-        )
+        monkeypatch.setattr(mock_migration_analyzer, "find_migration_resources", _raising(MigrationAnalysisError("Failed to find resources")))
         
         result = await get_migration_resources("nonexistent", "1.0.0", "2.0.0")
         
@@ -581,13 +534,9 @@ class TestGetMigrationResources:
         assert "error" in result
         assert "Failed to find resources" in result["error"]
 
-    @pytest.mark.asyncio
-    @patch('mcp_server.server._migration_analyzer')
-    async def test_get_migration_resources_unexpected_error(self, mock_analyzer):
+    async def test_get_migration_resources_unexpected_error(self, mock_migration_analyzer, monkeypatch):
         """Test migration resource discovery with unexpected error."""
-        mock_analyzer.find_migration_resources = AsyncMock(
-            side_effect=Exception("Unexpected error")
-        )
+        monkeypatch.setattr(mock_migration_analyzer, "find_migration_resources", _raising(Exception("Unexpected error")))
         
         result = await get_migration_resources("requests", "2.25.0", "2.26.0")
         
@@ -599,16 +548,14 @@ class TestGetMigrationResources:
         assert "error" in result
         assert "Resource discovery failed" in result["error"]
 
-    @pytest.mark.asyncio
-    @patch('mcp_server.server._migration_analyzer')
-    async def test_get_migration_resources_empty_results(self, mock_analyzer):
+    async def test_get_migration_resources_empty_results(self, mock_migration_analyzer):
         """Test migration resource discovery with empty results."""
         mock_resources = MigrationResources(
             package_name="obscure-package",
             version_range="1.0.0 -> 2.0.0",
             search_timestamp="2023-01-01T00:00:00Z"
         )
-        mock_analyzer.find_migration_resources = AsyncMock(return_value=mock_resources)
+        mock_migration_analyzer.find_migration_resources.return_value = mock_resources
         
         result = await get_migration_resources("obscure-package", "1.0.0", "2.0.0")
         
@@ -618,21 +565,3 @@ class TestGetMigrationResources:
         assert len(result["community_resources"]) == 0
         assert len(result["documentation_links"]) == 0
         assert "error" not in result
-
-
-class TestMigrationToolsIntegration:
-    """Integration tests for migration tools."""
-
-    def test_migration_analyzer_singleton_exists(self):
-        """Test that migration analyzer singleton is properly initialized."""
-        assert _migration_analyzer is not None
-        assert _migration_analyzer.package_manager is _pkg
-
-    @pytest.mark.asyncio
-    async def test_migration_tools_async_compatibility(self):
-        """Test that migration tools are properly async."""
-        # These should be async functions
-        import inspect
-        assert inspect.iscoroutinefunction(analyze_package_api_surface)
-        assert inspect.iscoroutinefunction(compare_package_versions)
-        assert inspect.iscoroutinefunction(get_migration_resources)
\ No newline at end of file
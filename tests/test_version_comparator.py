@@ -1,6 +1,7 @@
 """Tests for version comparison functionality."""
 
-from unittest.mock import Mock, patch
+from dataclasses import replace
+from unittest.mock import Mock
 
 import pytest
 
@@ -10,129 +11,172 @@ from mcp_server.version_comparator import VersionComparator
 from mcp_server.errors import VersionComparisonError
 
 
-class TestVersionComparator:
-    """Test the VersionComparator class."""
+def _fn(name, sig, doc="", kind="function", **kw):
+    return APIElement(name=name, type=kind, signature=sig, docstring=doc, **kw)
 
-    @pytest.fixture
-    def mock_package_manager(self):
-        """Create a mock package manager."""
-        return Mock(spec=PackageManager)
 
-    @pytest.fixture
-    def version_comparator(self, mock_package_manager):
-        """Create a version comparator with mocked dependencies."""
-        return VersionComparator(mock_package_manager)
+def _cls(name, sig, doc=""):
+    return APIElement(name=name, type="class", signature=sig, docstring=doc)
 
-    @pytest.fixture
-    def sample_old_surface(self):
-        """Create a sample old API surface."""
-        return APISurface(
-            package_name="test_package",
-            version="1.0.0",
-            classes=[
-                APIElement(
-                    name="TestClass",
-                    type="class",
-                    signature="class TestClass",
-                    docstring="A test class."
-                )
-            ],
-            functions=[
-                APIElement(
-                    name="old_function",
-                    type="function",
-                    signature="def old_function(x: int) -> str",
-                    docstring="An old function."
-                ),
-                APIElement(
-                    name="modified_function",
-                    type="function",
-                    signature="def modified_function(a: str) -> str",
-                    docstring="A function that will be modified."
-                ),
-                APIElement(
-                    name="to_be_deprecated",
-                    type="function",
-                    signature="def to_be_deprecated() -> None",
-                    docstring="A function that will be deprecated.",
-                    is_deprecated=False
-                )
-            ],
-            constants=[
-                APIElement(
-                    name="OLD_CONSTANT",
-                    type="constant",
-                    signature="OLD_CONSTANT: str = 'old_value'",
-                    docstring="An old constant."
-                )
-            ]
-        )
 
-    @pytest.fixture
-    def sample_new_surface(self):
-        """Create a sample new API surface."""
-        return APISurface(
-            package_name="test_package",
-            version="2.0.0",
-            classes=[
-                APIElement(
-                    name="TestClass",
-                    type="class",
-                    signature="class TestClass",
-                    docstring="A test class."
-                ),
-                APIElement(
-                    name="NewClass",
-                    type="class",
-                    signature="class NewClass",
-                    docstring="A new class."
-                )
-            ],
-            functions=[
-                APIElement(
-                    name="new_function",
-                    type="function",
-                    signature="def new_function(y: float) -> int",
-                    docstring="A new function."
-                ),
-                APIElement(
-                    name="modified_function",
-                    type="function",
-                    signature="def modified_function(a: str, b: int = 10) -> str",
-                    docstring="A function that was modified."
-                ),
-                APIElement(
-                    name="to_be_deprecated",
-                    type="function",
-                    signature="def to_be_deprecated() -> None",
-                    docstring="A function that is now deprecated.",
-                    is_deprecated=True,
-                    deprecation_message="Use new_function instead"
-                )
-            ],
-            constants=[
-                APIElement(
-                    name="NEW_CONSTANT",
-                    type="constant",
-                    signature="NEW_CONSTANT: int = 42",
-                    docstring="A new constant."
-                )
-            ]
+def _const(name, sig, doc=""):
+    return APIElement(name=name, type="constant", signature=sig, docstring=doc)
+
+
+_OLD_SURFACE = APISurface(
+    package_name="test_package",
+    version="1.0.0",
+    classes=[_cls("TestClass", "class TestClass", "A test class.")],
+    functions=[
+        _fn("old_function", "def old_function(x: int) -> str", "An old function."),
+        _fn("modified_function", "def modified_function(a: str) -> str", "A function that will be modified."),
+        _fn(
+            "to_be_deprecated", "def to_be_deprecated() -> None", "A function that will be deprecated.",
+            is_deprecated=False
+        )
+    ],
+    constants=[_const("OLD_CONSTANT", "OLD_CONSTANT: str = 'old_value'", "An old constant.")]
+)
+
+_NEW_SURFACE = APISurface(
+    package_name="test_package",
+    version="2.0.0",
+    classes=[
+        _cls("TestClass", "class TestClass", "A test class."),
+        _cls("NewClass", "class NewClass", "A new class.")
+    ],
+    functions=[
+        _fn("new_function", "def new_function(y: float) -> int", "A new function."),
+        _fn(
+            "modified_function", "def modified_function(a: str, b: int = 10) -> str",
+            "A function that was modified."
+        ),
+        _fn(
+            "to_be_deprecated", "def to_be_deprecated() -> None", "A function that is now deprecated.",
+            is_deprecated=True, deprecation_message="Use new_function instead"
+        )
+    ],
+    constants=[_const("NEW_CONSTANT", "NEW_CONSTANT: int = 42", "A new constant.")]
+)
+
+
+# Package that added async support and deprecated the sync API
+_ASYNC_OLD = APISurface(
+    package_name="example_lib",
+    version="1.0.0",
+    functions=[
+        _fn("fetch_data", "def fetch_data(url: str) -> dict", "Fetch data synchronously."),
+        _fn("process_data", "def process_data(data: dict) -> str", "Process the data.")
+    ]
+)
+
+_ASYNC_NEW = APISurface(
+    package_name="example_lib",
+    version="2.0.0",
+    functions=[
+        _fn(
+            "fetch_data", "def fetch_data(url: str) -> dict",
+            "Fetch data synchronously. Deprecated: use async_fetch_data.",
+            is_deprecated=True, deprecation_message="Use async_fetch_data instead"
+        ),
+        _fn(
+            "async_fetch_data", "async def async_fetch_data(url: str) -> dict", "Fetch data asynchronously.",
+            kind="async_function"
+        ),
+        _fn(
+            "process_data", "def process_data(data: dict, format: str = 'json') -> str",
+            "Process the data with optional format."
         )
+    ]
+)
+
+
+# Major version that removed a base class and a parameter default
+_CLIENT_V1 = _cls("Client", "class Client(BaseClient)", "Main client class.")
+_CLIENT_V2 = replace(_CLIENT_V1, signature="class Client")
+_CONNECT_V1 = _fn(
+    "connect", "def connect(host: str, port: int = 8080, timeout: int = 30) -> Connection",
+    "Connect to server."
+)
+_CONNECT_V2 = replace(_CONNECT_V1, signature="def connect(host: str, port: int, timeout: int = 30) -> Connection")
+
+_BREAKING_OLD = APISurface(
+    package_name="breaking_lib", version="1.5.0", classes=[_CLIENT_V1], functions=[_CONNECT_V1]
+)
+_BREAKING_NEW = APISurface(
+    package_name="breaking_lib", version="2.0.0", classes=[_CLIENT_V2], functions=[_CONNECT_V2]
+)
+
+
+@pytest.fixture(scope="module")
+def mock_package_manager():
+    """Create a mock package manager shared by the module."""
+    return Mock(spec=PackageManager)
+
+
+@pytest.fixture(scope="module")
+def version_comparator(mock_package_manager):
+    """Create a version comparator with mocked dependencies."""
+    return VersionComparator(mock_package_manager)
+
+
+# Changes the comparator must report between the two sample surfaces
+_EXPECTED_ADDITIONS = frozenset({"new_function", "NewClass", "NEW_CONSTANT"})
+_EXPECTED_REMOVALS = frozenset({"old_function", "OLD_CONSTANT"})
+_EXPECTED_DEPRECATIONS = frozenset({"to_be_deprecated"})
+_OLD_ELEMENT_NAMES = frozenset({"TestClass", "old_function", "modified_function", "OLD_CONSTANT"})
+
 
-    def test_compare_api_surfaces_basic(self, version_comparator, sample_old_surface, sample_new_surface):
+class TestVersionComparator:
+    """Test the VersionComparator class."""
+
+    @pytest.fixture(scope="module")
+    def sample_old_surface(self):
+        """Sample old API surface (shared, read-only)."""
+        return _OLD_SURFACE
+
+    @pytest.fixture(scope="module")
+    def sample_new_surface(self):
+        """Sample new API surface (shared, read-only)."""
+        return _NEW_SURFACE
+
+    @pytest.fixture(scope="module")
+    def old_element_map(self, version_comparator, sample_old_surface):
+        """Element map of the old sample surface."""
+        return version_comparator._create_element_map(sample_old_surface)
+
+    @pytest.fixture(scope="module")
+    def new_element_map(self, version_comparator, sample_new_surface):
+        """Element map of the new sample surface."""
+        return version_comparator._create_element_map(sample_new_surface)
+
+    @pytest.fixture(scope="module")
+    def comparison(self, version_comparator, sample_old_surface, sample_new_surface):
+        """Comparison of the two sample surfaces, shared by the read-only tests."""
+        return version_comparator.compare_api_surfaces(sample_old_surface, sample_new_surface)
+
+    @pytest.fixture(scope="module")
+    def changes_by_name(self, comparison):
+        """Changes in each category of the shared comparison, keyed by element name."""
+        return {
+            "add": {c.element_name: c for c in comparison.additions},
+            "mod": {c.element_name: c for c in comparison.modifications},
+            "dep": {c.element_name: c for c in comparison.deprecations},
+            "brk": {c.element_name: c for c in comparison.breaking_changes},
+        }
+
+    def test_compare_api_surfaces_basic(self, comparison, changes_by_name):
         """Test basic API surface comparison."""
-        comparison = version_comparator.compare_api_surfaces(sample_old_surface, sample_new_surface)
-        
         assert isinstance(comparison, VersionComparison)
         assert comparison.package_name == "test_package"
         assert comparison.old_version == "1.0.0"
         assert comparison.new_version == "2.0.0"
         
         # Check that we have changes in each category
-        assert len(comparison.additions) > 0
-        assert len(comparison.modifications) > 0
-        assert len(comparison.deprecations) > 0
+        assert "NewClass" in changes_by_name["add"]
+        assert "modified_function" in changes_by_name["mod"]
+        assert "to_be_deprecated" in changes_by_name["dep"]
+        assert "old_function" in changes_by_name["brk"]
 
     def test_compare_different_packages_raises_error(self, version_comparator):
         """Test that comparing different packages raises an error."""
@@ -142,124 +186,92 @@ class TestVersionComparator:
         with pytest.raises(VersionComparisonError):
             version_comparator.compare_api_surfaces(old_surface, new_surface)
 
-    def test_detect_additions(self, version_comparator, sample_old_surface, sample_new_surface):
+    def test_detect_additions(self, comparison, changes_by_name):
         """Test detection of API additions."""
-        additions = version_comparator.detect_additions(sample_old_surface, sample_new_surface)
-        
         # Should detect new function, new class, and new constant
-        addition_names = {change.element_name for change in additions}
-        assert "new_function" in addition_names
-        assert "NewClass" in addition_names
-        assert "NEW_CONSTANT" in addition_names
+        assert _EXPECTED_ADDITIONS.issubset(changes_by_name["add"])
         
         # Check that all additions have correct change type
-        for addition in additions:
+        for addition in comparison.additions:
             assert addition.change_type == "added"
             assert addition.impact_level == "enhancement"
 
-    def test_detect_removals(self, version_comparator, sample_old_surface, sample_new_surface):
+    def test_detect_removals(self, version_comparator, old_element_map, new_element_map):
         """Test detection of API removals."""
-        old_elements = version_comparator._create_element_map(sample_old_surface)
-        new_elements = version_comparator._create_element_map(sample_new_surface)
-        
-        removals = version_comparator._detect_removals(old_elements, new_elements)
+        removals = version_comparator._detect_removals(old_element_map, new_element_map)
         
         # Should detect removed function and constant
-        removal_names = {change.element_name for change in removals}
-        assert "old_function" in removal_names
-        assert "OLD_CONSTANT" in removal_names
+        assert _EXPECTED_REMOVALS.issubset(change.element_name for change in removals)
         
         # Check that all removals are marked as breaking
         for removal in removals:
             assert removal.change_type == "removed"
             assert removal.impact_level == "breaking"
 
-    def test_detect_modifications(self, version_comparator, sample_old_surface, sample_new_surface):
+    def test_detect_modifications(self, version_comparator, old_element_map, new_element_map):
         """Test detection of API modifications."""
-        old_elements = version_comparator._create_element_map(sample_old_surface)
-        new_elements = version_comparator._create_element_map(sample_new_surface)
-        
-        modifications = version_comparator._detect_modifications(old_elements, new_elements)
+        modifications = version_comparator._detect_modifications(old_element_map, new_element_map)
         
         # Should detect modified function
-        modification_names = {change.element_name for change in modifications}
-        assert "modified_function" in modification_names
+        by_name = {change.element_name: change for change in modifications}
+        assert "modified_function" in by_name
         
         # Check modification details
-        mod_change = next(c for c in modifications if c.element_name == "modified_function")
+        mod_change = by_name["modified_function"]
         assert mod_change.change_type == "modified"
         assert "def modified_function(a: str)" in mod_change.old_signature
         assert "def modified_function(a: str, b: int = 10)" in mod_change.new_signature
 
-    def test_detect_deprecations(self, version_comparator, sample_old_surface, sample_new_surface):
+    def test_detect_deprecations(self, changes_by_name):
         """Test detection of new deprecations."""
-        deprecations = version_comparator.detect_deprecations(sample_old_surface, sample_new_surface)
-        
         # Should detect newly deprecated function
-        deprecation_names = {change.element_name for change in deprecations}
-        assert "to_be_deprecated" in deprecation_names
+        assert _EXPECTED_DEPRECATIONS.issubset(changes_by_name["dep"])
         
         # Check deprecation details
-        dep_change = next(c for c in deprecations if c.element_name == "to_be_deprecated")
+        dep_change = changes_by_name["dep"]["to_be_deprecated"]
         assert dep_change.change_type == "deprecated"
         assert dep_change.impact_level == "compatible"
         assert "Use new_function instead" in dep_change.description
 
-    def test_assess_function_signature_change_breaking(self, version_comparator):
-        """Test assessment of breaking function signature changes."""
-        old_sig = "def func(a: str, b: int) -> str"
-        new_sig = "def func(a: str) -> str"  # Removed parameter
-        
+    @pytest.mark.parametrize("old_sig,new_sig,expected", [
+        ("def func(a: str, b: int) -> str", "def func(a: str) -> str", "breaking"),
+        ("def func(a: str) -> str", "def func(a: str, b: int = 10) -> str", "enhancement"),
+        ("def func(a: str, b: int = 10) -> str", "def func(a: str, b: int) -> str", "breaking"),
+    ], ids=["removed_param", "added_optional", "removed_default"])
+    def test_assess_function_signature_change(self, version_comparator, old_sig, new_sig, expected):
+        """Test assessment of function signature changes."""
         impact = version_comparator._assess_function_signature_change(old_sig, new_sig)
-        assert impact == "breaking"
-
-    def test_assess_function_signature_change_compatible(self, version_comparator):
-        """Test assessment of compatible function signature changes."""
-        old_sig = "def func(a: str) -> str"
-        new_sig = "def func(a: str, b: int = 10) -> str"  # Added optional parameter
-        
-        impact = version_comparator._assess_function_signature_change(old_sig, new_sig)
-        assert impact == "enhancement"
-
-    def test_assess_function_signature_change_removed_default(self, version_comparator):
-        """Test assessment when default value is removed (breaking)."""
-        old_sig = "def func(a: str, b: int = 10) -> str"
-        new_sig = "def func(a: str, b: int) -> str"  # Removed default value
-        
-        impact = version_comparator._assess_function_signature_change(old_sig, new_sig)
-        assert impact == "breaking"
-
-    def test_extract_parameters_simple(self, version_comparator):
-        """Test parameter extraction from simple function signature."""
-        signature = "def func(a: str, b: int = 10) -> str"
-        params = version_comparator._extract_parameters(signature)
-        
-        assert len(params) == 2
-        assert params[0]['name'] == 'a'
-        assert not params[0]['has_default']
-        assert params[1]['name'] == 'b'
-        assert params[1]['has_default']
-
-    def test_extract_parameters_complex(self, version_comparator):
-        """Test parameter extraction from complex function signature."""
-        signature = "def func(a: str, *args, b: int = 10, **kwargs) -> str"
+        assert impact == expected
+
+    @pytest.mark.parametrize("signature,expected", [
+        pytest.param(
+            "def func(a: str, b: int = 10) -> str",
+            [("a", False), ("b", True)],
+            id="simple"
+        ),
+        pytest.param(
+            "def func(a: str, *args, b: int = 10, **kwargs) -> str",
+            [("a", False), ("*args", False), ("b", True), ("**kwargs", False)],
+            id="complex"
+        ),
+    ])
+    def test_extract_parameters(self, version_comparator, signature, expected):
+        """Test parameter extraction from function signatures."""
         params = version_comparator._extract_parameters(signature)
         
-        param_names = [p['name'] for p in params]
-        assert 'a' in param_names
-        assert '*args' in param_names
-        assert 'b' in param_names
-        assert '**kwargs' in param_names
-
-    def test_split_parameters_nested(self, version_comparator):
-        """Test parameter splitting with nested structures."""
-        param_str = "a: str, b: List[Dict[str, int]], c: int = 10"
-        params = version_comparator._split_parameters(param_str)
-        
-        assert len(params) == 3
-        assert params[0] == "a: str"
-        assert params[1] == "b: List[Dict[str, int]]"
-        assert params[2] == "c: int = 10"
+        assert [(p['name'], p['has_default']) for p in params] == expected
+
+    @pytest.mark.parametrize("param_str,expected", [
+        pytest.param("a: str, b: int = 10", ["a: str", "b: int = 10"], id="simple"),
+        pytest.param(
+            "a: str, b: List[Dict[str, int]], c: int = 10",
+            ["a: str", "b: List[Dict[str, int]]", "c: int = 10"],
+            id="nested"
+        ),
+    ])
+    def test_split_parameters(self, version_comparator, param_str, expected):
+        """Test parameter splitting, including nested structures."""
+        assert version_comparator._split_parameters(param_str) == expected
 
     def test_extract_base_classes(self, version_comparator):
         """Test extraction of base classes from class signature."""
@@ -278,15 +290,10 @@ class TestVersionComparator:
         impact = version_comparator._assess_class_signature_change(old_sig, new_sig)
         assert impact == "enhancement"
 
-    def test_create_element_map(self, version_comparator, sample_old_surface):
+    def test_create_element_map(self, old_element_map):
         """Test creation of element map from API surface."""
-        element_map = version_comparator._create_element_map(sample_old_surface)
-        
         # Check that all elements are mapped correctly
-        assert "TestClass" in element_map
-        assert "old_function" in element_map
-        assert "modified_function" in element_map
-        assert "OLD_CONSTANT" in element_map
+        assert _OLD_ELEMENT_NAMES.issubset(old_element_map)
 
     def test_create_element_map_with_methods(self, version_comparator):
         """Test element map creation with class methods."""
@@ -336,147 +343,49 @@ class TestVersionComparator:
         assert "func1" in breaking_names
         assert "func3" in breaking_names
 
-    @patch('mcp_server.version_comparator.VersionComparator._analyze_dependency_changes')
-    def test_analyze_dependency_changes_called(self, mock_analyze_deps, version_comparator, sample_old_surface, sample_new_surface):
+    def test_analyze_dependency_changes_called(self, monkeypatch, version_comparator, sample_old_surface, sample_new_surface):
         """Test that dependency analysis is called during comparison."""
-        mock_analyze_deps.return_value = ["Added dependency: requests >=2.0.0"]
+        calls = []
+        
+        def fake_analyze_deps(self_, package_name, old_version, new_version):
+            calls.append((package_name, old_version, new_version))
+            return ["Added dependency: requests >=2.0.0"]
+        
+        monkeypatch.setattr(VersionComparator, "_analyze_dependency_changes", fake_analyze_deps)
         
         comparison = version_comparator.compare_api_surfaces(sample_old_surface, sample_new_surface)
         
-        mock_analyze_deps.assert_called_once_with("test_package", "1.0.0", "2.0.0")
+        assert calls == [("test_package", "1.0.0", "2.0.0")]
         assert len(comparison.dependency_changes) == 1
         assert "Added dependency: requests" in comparison.dependency_changes[0]
 
 
+@pytest.mark.slow
 class TestVersionComparatorIntegration:
     """Integration tests for version comparator with real-like scenarios."""
 
-    @pytest.fixture
-    def version_comparator(self):
-        """Create a version comparator with real package manager."""
-        mock_pm = Mock(spec=PackageManager)
-        return VersionComparator(mock_pm)
-
-    def test_real_package_scenario(self, version_comparator):
-        """Test with a realistic package evolution scenario."""
-        # Simulate a package that added async support
-        old_surface = APISurface(
-            package_name="example_lib",
-            version="1.0.0",
-            functions=[
-                APIElement(
-                    name="fetch_data",
-                    type="function",
-                    signature="def fetch_data(url: str) -> dict",
-                    docstring="Fetch data synchronously."
-                ),
-                APIElement(
-                    name="process_data",
-                    type="function",
-                    signature="def process_data(data: dict) -> str",
-                    docstring="Process the data."
-                )
-            ]
-        )
-        
-        new_surface = APISurface(
-            package_name="example_lib",
-            version="2.0.0",
-            functions=[
-                APIElement(
-                    name="fetch_data",
-                    type="function",
-                    signature="def fetch_data(url: str) -> dict",
-                    docstring="Fetch data synchronously. Deprecated: use async_fetch_data.",
-                    is_deprecated=True,
-                    deprecation_message="Use async_fetch_data instead"
-                ),
-                APIElement(
-                    name="async_fetch_data",
-                    type="async_function",
-                    signature="async def async_fetch_data(url: str) -> dict",
-                    docstring="Fetch data asynchronously."
-                ),
-                APIElement(
-                    name="process_data",
-                    type="function",
-                    signature="def process_data(data: dict, format: str = 'json') -> str",
-                    docstring="Process the data with optional format."
-                )
-            ]
-        )
-        
-        comparison = version_comparator.compare_api_surfaces(old_surface, new_surface)
-        
-        # Should detect addition of async function
-        addition_names = {change.element_name for change in comparison.additions}
-        assert "async_fetch_data" in addition_names
-        
-        # Should detect deprecation of sync function
-        deprecation_names = {change.element_name for change in comparison.deprecations}
-        assert "fetch_data" in deprecation_names
-        
-        # Should detect modification of process_data (added optional parameter)
-        modification_names = {change.element_name for change in comparison.modifications}
-        assert "process_data" in modification_names
-        
-        # The modification should be compatible (added optional parameter)
-        process_mod = next(c for c in comparison.modifications if c.element_name == "process_data")
-        assert process_mod.impact_level == "enhancement"
-
-    def test_breaking_change_scenario(self, version_comparator):
-        """Test detection of breaking changes in a major version update."""
-        old_surface = APISurface(
-            package_name="breaking_lib",
-            version="1.5.0",
-            classes=[
-                APIElement(
-                    name="Client",
-                    type="class",
-                    signature="class Client(BaseClient)",
-                    docstring="Main client class."
-                )
-            ],
-            functions=[
-                APIElement(
-                    name="connect",
-                    type="function",
-                    signature="def connect(host: str, port: int = 8080, timeout: int = 30) -> Connection",
-                    docstring="Connect to server."
-                )
-            ]
-        )
-        
-        new_surface = APISurface(
-            package_name="breaking_lib",
-            version="2.0.0",
-            classes=[
-                APIElement(
-                    name="Client",
-                    type="class",
-                    signature="class Client",  # Removed base class
-                    docstring="Main client class."
-                )
-            ],
-            functions=[
-                APIElement(
-                    name="connect",
-                    type="function",
-                    signature="def connect(host: str, port: int, timeout: int = 30) -> Connection",
-                    docstring="Connect to server."
-                )
-            ]
-        )
-        
+    @pytest.mark.parametrize("old_surface,new_surface,adds,deps,mods,breaks", [
+        pytest.param(
+            _ASYNC_OLD, _ASYNC_NEW,
+            {"async_fetch_data"}, {"fetch_data"}, {"process_data": "enhancement"}, set(),
+            id="async_migration"
+        ),
+        pytest.param(
+            _BREAKING_OLD, _BREAKING_NEW,
+            set(), set(), {"connect": "breaking"}, {"Client", "connect"},
+            id="breaking_major"
+        ),
+    ])
+    def test_package_scenario(self, version_comparator, old_surface, new_surface, adds, deps, mods, breaks):
+        """Test realistic package evolution scenarios."""
         comparison = version_comparator.compare_api_surfaces(old_surface, new_surface)
         
-        # Should detect breaking changes
-        assert len(comparison.breaking_changes) > 0
-        
-        # Check specific breaking changes
-        breaking_names = {change.element_name for change in comparison.breaking_changes}
+        assert adds <= {change.element_name for change in comparison.additions}
+        assert deps <= {change.element_name for change in comparison.deprecations}
+        assert breaks <= {change.element_name for change in comparison.breaking_changes}
+        assert all(change.impact_level == "breaking" for change in comparison.breaking_changes)
         
-        # Function signature change (removed default value) should be breaking
-        if "connect" in breaking_names:
-            connect_change = next(c for c in comparison.breaking_changes if c.element_name == "connect")
-            assert connect_change.impact_level == "breaking"
\ No newline at end of file
+        # Added optional parameters are enhancements; removed defaults are breaking
+        mod_impacts = {change.element_name: change.impact_level for change in comparison.modifications}
+        for name, impact in mods.items():
+            assert mod_impacts[name] == impact